@@ -11,25 +11,34 @@ except ImportError:
 
 
 class HandDetector:
-    def __init__(self, model_type: str = "mediapipe", detect_hands_lr: bool = True):
+    def __init__(self, model_type: str = "mediapipe", detect_hands_lr: bool = True, backend: str = "auto"):
         """
         Initialize hand detector.
         
         Args:
             model_type: Type of model to use ('mediapipe', 'tiny', 'prn', 'v4-tiny', or 'yolo')
             detect_hands_lr: If True, detect left/right hands (only works with 'mediapipe')
+            backend: OpenCV DNN backend for YOLO models ('auto', 'cuda', 'openvino' or 'cpu').
+                     'auto' uses CUDA if available, then OpenVINO, then the plain CPU backend
         """
         self.model_type = model_type
         self.detect_hands_lr = detect_hands_lr
+        self.backend = backend
         self.net = None
         self.output_layers = None
         self.classes = ["hand"]
         self.confidence_threshold = 0.2  # Reduced from 0.5 for more sensitive detection
         self.nms_threshold = 0.4
         
+        # YOLO input buffers, reused for every frame instead of a fresh blob per call
+        self.input_size = 416
+        self._resized = np.empty((self.input_size, self.input_size, 3), dtype=np.uint8)
+        self._blob = np.empty((1, 3, self.input_size, self.input_size), dtype=np.float32)
+        
         # MediaPipe setup
         self.mp_hands = None
         self.hands_detector = None
+        self._rgb = None  # RGB copy of the frame for MediaPipe, reused while the frame size holds
         
         self.load_model()
         
@@ -50,6 +59,10 @@ class HandDetector:
                         self.model_type = "prn"
                     else:
                         self.mp_hands = mp.solutions.hands
+                        # Video mode: after the first detection, hands are tracked from the
+                        # previous frame's landmarks and the palm detector only reruns when
+                        # tracking confidence drops, so callers must not crop the frame
+                        # (that would break tracking) and should reuse one detector per stream
                         self.hands_detector = self.mp_hands.Hands(
                             static_image_mode=False,
                             max_num_hands=2,
@@ -93,19 +106,44 @@ class HandDetector:
                 return
                 
             self.net = cv2.dnn.readNet(weights_path, cfg_path)
-            self.net.setPreferableBackend(cv2.dnn.DNN_BACKEND_OPENCV)
-            self.net.setPreferableTarget(cv2.dnn.DNN_TARGET_CPU)
+            backend_name = self._select_backend()
             
             # Get output layer names
             layer_names = self.net.getLayerNames()
             self.output_layers = [layer_names[i - 1] for i in self.net.getUnconnectedOutLayers()]
             
-            print(f"✓ Successfully loaded {self.model_type} YOLO model")
+            print(f"✓ Successfully loaded {self.model_type} YOLO model ({backend_name})")
         except Exception as e:
             print(f"✗ Error loading model: {e}")
             print("  Please make sure models are downloaded. Run: cd models && sh download-models.sh")
             self.net = None
     
+    def _select_backend(self) -> str:
+        """Point the YOLO net at the fastest backend this OpenCV build supports. Returns its name."""
+        if self.backend in ("auto", "cuda"):
+            try:
+                # Only CUDA-enabled OpenCV builds report devices here
+                if cv2.cuda.getCudaEnabledDeviceCount() > 0:
+                    self.net.setPreferableBackend(cv2.dnn.DNN_BACKEND_CUDA)
+                    self.net.setPreferableTarget(cv2.dnn.DNN_TARGET_CUDA_FP16)
+                    return "CUDA"
+            except (AttributeError, cv2.error):
+                pass
+        
+        if self.backend in ("auto", "openvino"):
+            try:
+                available = [backend for backend, _ in cv2.dnn.getAvailableBackends()]
+                if cv2.dnn.DNN_BACKEND_INFERENCE_ENGINE in available:
+                    self.net.setPreferableBackend(cv2.dnn.DNN_BACKEND_INFERENCE_ENGINE)
+                    self.net.setPreferableTarget(cv2.dnn.DNN_TARGET_CPU)
+                    return "OpenVINO"
+            except (AttributeError, cv2.error):
+                pass
+        
+        self.net.setPreferableBackend(cv2.dnn.DNN_BACKEND_OPENCV)
+        self.net.setPreferableTarget(cv2.dnn.DNN_TARGET_CPU)
+        return "CPU"
+    
     def detect_hands(self, frame: np.ndarray) -> List[dict]:
         """
         Detect hands in a frame.
@@ -126,28 +164,28 @@ class HandDetector:
         """Detect hands using MediaPipe with left/right classification."""
         height, width = frame.shape[:2]
         
-        # Convert BGR to RGB for MediaPipe
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.hands_detector.process(rgb_frame)
+        # Convert BGR to RGB for MediaPipe with a plain channel-reversed copy into a reused
+        # buffer: cvtColor would fan the swap out over every core, competing with
+        # MediaPipe's own worker threads
+        if self._rgb is None or self._rgb.shape != frame.shape:
+            self._rgb = np.empty(frame.shape, dtype=np.uint8)
+        np.copyto(self._rgb, frame[:, :, ::-1])
+        results = self.hands_detector.process(self._rgb)
         
         hands = []
         if results.multi_hand_landmarks and results.multi_handedness:
             for hand_landmarks, handedness in zip(results.multi_hand_landmarks, results.multi_handedness):
-                # Get bounding box from landmarks
-                x_coords = [lm.x for lm in hand_landmarks.landmark]
-                y_coords = [lm.y for lm in hand_landmarks.landmark]
-                
-                x_min = int(min(x_coords) * width)
-                y_min = int(min(y_coords) * height)
-                x_max = int(max(x_coords) * width)
-                y_max = int(max(y_coords) * height)
+                # Get bounding box from landmarks: one read of the 21 (x, y) pairs,
+                # then min/max over both axes at once
+                coords = np.array([(lm.x, lm.y) for lm in hand_landmarks.landmark])
+                frame_size = (width, height)
+                mins = (coords.min(axis=0) * frame_size).astype(int)
+                maxs = (coords.max(axis=0) * frame_size).astype(int)
                 
                 # Add some padding
                 padding = 20
-                x_min = max(0, x_min - padding)
-                y_min = max(0, y_min - padding)
-                x_max = min(width, x_max + padding)
-                y_max = min(height, y_max + padding)
+                x_min, y_min = np.maximum(mins - padding, 0).tolist()
+                x_max, y_max = np.minimum(maxs + padding, frame_size).tolist()
                 
                 w = x_max - x_min
                 h = y_max - y_min
@@ -172,30 +210,33 @@ class HandDetector:
             return []
         
         height, width = frame.shape[:2]
-        blob = cv2.dnn.blobFromImage(frame, 0.00392, (416, 416), (0, 0, 0), True, crop=False)
-        self.net.setInput(blob)
+        # Same as blobFromImage(frame, 0.00392, (416, 416), swapRB=True, crop=False),
+        # written into the preallocated buffers: resize, BGR->RGB, HWC->CHW, scale
+        cv2.resize(frame, (self.input_size, self.input_size), dst=self._resized)
+        np.multiply(self._resized[:, :, ::-1].transpose(2, 0, 1), 0.00392,
+                    out=self._blob[0], dtype=np.float32)
+        self.net.setInput(self._blob)
         outputs = self.net.forward(self.output_layers)
         
-        boxes = []
-        confidences = []
+        # Score every anchor of every output layer at once: best class score per row
+        # (the class itself is never used), then keep the rows above the threshold
+        detections = np.concatenate(outputs, axis=0)
+        all_confidences = detections[:, 5:].max(axis=1)
+        keep = all_confidences > self.confidence_threshold
+        if not keep.any():
+            return []
+        kept = detections[keep]
         
-        for output in outputs:
-            for detection in output:
-                scores = detection[5:]
-                class_id = np.argmax(scores)
-                confidence = scores[class_id]
-                
-                if confidence > self.confidence_threshold:
-                    center_x = int(detection[0] * width)
-                    center_y = int(detection[1] * height)
-                    w = int(detection[2] * width)
-                    h = int(detection[3] * height)
-                    
-                    x = int(center_x - w / 2)
-                    y = int(center_y - h / 2)
-                    
-                    boxes.append([x, y, w, h])
-                    confidences.append(float(confidence))
+        # Box centers/sizes are relative to the frame; truncate like int() did
+        center_x = (kept[:, 0] * width).astype(int)
+        center_y = (kept[:, 1] * height).astype(int)
+        w = (kept[:, 2] * width).astype(int)
+        h = (kept[:, 3] * height).astype(int)
+        x = (center_x - w / 2).astype(int)
+        y = (center_y - h / 2).astype(int)
+        
+        boxes = np.stack([x, y, w, h], axis=1).tolist()
+        confidences = all_confidences[keep].tolist()
         
         # Apply non-maximum suppression
         indices = cv2.dnn.NMSBoxes(boxes, confidences, self.confidence_threshold, self.nms_threshold)
@@ -223,11 +264,8 @@ class HandDetector:
         Returns:
             'jump' if upward gesture detected, None otherwise
         """
-        hands = self.detect_hands(frame)
-        
-        if len(hands) > 0:
-            # Get the hand with highest confidence
-            hand = max(hands, key=lambda h: h['confidence'])
+        # Any detected hand counts; which one doesn't change the result
+        if self.detect_hands(frame):
             return 'jump'
         
         return None
@@ -237,7 +275,7 @@ class HandDetector:
         if self.hands_detector is not None:
             self.hands_detector.close()
     
-    def draw_detections(self, frame: np.ndarray, hands: List[dict]) -> np.ndarray:
+    def draw_detections(self, frame: np.ndarray, hands: List[dict], in_place: bool = False) -> np.ndarray:
         """
         Draw hand detections on frame as simple colored circles/balls.
         Always shows both left and right hand positions (solid circles, dimmer when not detected).
@@ -245,11 +283,13 @@ class HandDetector:
         Args:
             frame: Input frame
             hands: List of detected hands
+            in_place: If True, draw directly on frame instead of a copy (for callers
+                      that don't need the undrawn frame afterwards)
             
         Returns:
             Frame with detections drawn as circles
         """
-        result_frame = frame.copy()
+        result_frame = frame if in_place else frame.copy()
         height, width = frame.shape[:2]
         
         # Default radius for balls
@@ -10,7 +10,8 @@ from core.sound_manager import SoundManager
 
 
 class FlappyBirdController:
-    def __init__(self, use_hand_control: bool = True, model_type: str = "mediapipe", fullscreen: bool = False):
+    def __init__(self, use_hand_control: bool = True, model_type: str = "mediapipe", fullscreen: bool = False,
+                 use_opencl: bool = False):
         """
         Initialize Flappy Bird game controller.
         
@@ -18,6 +19,8 @@ class FlappyBirdController:
             use_hand_control: Whether to use hand gesture control
             model_type: Model type for hand detection ('mediapipe', 'tiny', 'prn', etc.)
             fullscreen: Whether to start in fullscreen mode
+            use_opencl: Whether to mirror webcam frames through OpenCL (when available)
+                        instead of flipping them in place on the CPU
         """
         self.fullscreen = fullscreen
         self.sound_manager = SoundManager()
@@ -64,6 +67,8 @@ class FlappyBirdController:
         self.running = True
         self.last_hand_positions = {}  # Track positions per hand: {hand_key: {'y': y_pos, 'frames_still': count}}
         self.last_jump_hand = None  # Track which hand performed the last jump (for alternating)
+        # Which hand must jump next, keyed by last jump hand (None = first jump, any hand is ok)
+        self._next_hand_map = {'Left': 'Right', 'Right': 'Left', None: 'Either'}
         self.jump_threshold = 32  # pixels to move up to trigger jump (increased by 2 for less sensitivity)
         self.frame_skip = 1  # Process every frame for better responsiveness (reduced from 2)
         self.frame_counter = 0
@@ -71,14 +76,19 @@ class FlappyBirdController:
         self.jump_cooldown_frames = 0  # Cooldown period (5 frames = ~0.08s at 60 FPS)
         self.still_threshold = 10  # pixels - if hand moves less than this, consider it still
         self.reset_after_still_frames = 20  # Reset position after 30 frames (~0.5s) of being still
+        self._use_opencl = use_opencl and cv2.ocl.haveOpenCL()  # Opt-in: mirror webcam frames on the OpenCL device
+        self.idle_preview_interval = 10  # Refresh webcam preview every N frames on the game over screen
+        self.fixed_dt = 1.0 / 60  # Simulation step; physics constants are tuned per 60 Hz tick
+        self.max_frame_time = 0.1  # Cap on real time simulated per frame after a stall
     
     def toggle_fullscreen(self):
         """Toggle between fullscreen and windowed mode."""
         self.fullscreen = not self.fullscreen
         if self.fullscreen:
-            self.game.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+            self.game.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN | pygame.DOUBLEBUF)
         else:
-            self.game.screen = pygame.display.set_mode((800, 600), pygame.RESIZABLE)
+            self.game.screen = pygame.display.set_mode((800, 600), pygame.RESIZABLE | pygame.DOUBLEBUF)
+        self.game.invalidate()
         # Note: All attributes are already initialized in __init__, no need to reset here
         
     def filter_hands(self, hands):
@@ -94,7 +104,14 @@ class FlappyBirdController:
         """
         if len(hands) == 0:
             return hands
-        
+
+        # Fast path: the usual steady state is exactly one Left and one Right hand
+        if len(hands) == 2:
+            h0, h1 = hands
+            a, b = h0.get('handedness'), h1.get('handedness')
+            if (a == 'Left' and b == 'Right') or (a == 'Right' and b == 'Left'):
+                return hands
+
         # Only keep hands with valid handedness
         valid_hands = [h for h in hands if h.get('handedness') in ['Left', 'Right']]
         
@@ -172,7 +189,7 @@ class FlappyBirdController:
         if self.jump_cooldown <= 0:
             # Process each detected hand
             for hand in hands:
-                center_y = hand['center'][1]
+                center_y = int(hand['center'][1])
                 handedness = hand.get('handedness', 'Unknown')  # 'Left', 'Right', or 'Unknown'
                 
                 # Skip hands without proper handedness detection (need L/R for alternating)
@@ -238,7 +255,7 @@ class FlappyBirdController:
         else:
             # Still update positions even during cooldown
             for hand in hands:
-                center_y = hand['center'][1]
+                center_y = int(hand['center'][1])
                 handedness = hand.get('handedness', 'Unknown')
                 if handedness != 'Unknown':
                     hand_key = handedness
@@ -274,6 +291,29 @@ class FlappyBirdController:
         
         return should_jump
     
+    def _mirror_frame(self, frame):
+        """
+        Flip a webcam frame horizontally for the mirror effect, in place by default.
+        
+        With OpenCL enabled the flip runs on the device through a UMat, but the frame has to
+        come straight back to the host for the hand detector and the BGR preview surface, so
+        the upload and download usually cost more than the flip saves. It is off by default.
+        """
+        if self._use_opencl:
+            return cv2.flip(cv2.UMat(frame), 1).get()
+        if not frame.flags.writeable:
+            frame = frame.copy()
+        cv2.flip(frame, 1, dst=frame)
+        return frame
+    
+    def _frame_to_surface(self, frame):
+        """
+        Wrap a BGR webcam frame as a Pygame surface for the preview. Pygame reads the BGR
+        bytes directly, so there is no color conversion or copy (the game scales and
+        converts the surface right away, before the frame is reused).
+        """
+        return pygame.image.frombuffer(frame.data, frame.shape[1::-1], "BGR")
+    
     def run(self):
         """
         Main game loop.
@@ -290,12 +330,17 @@ class FlappyBirdController:
             print(f"Error showing loading screen: {e}")
 
         clock = pygame.time.Clock()
+        accumulator = 0.0  # Real time not yet consumed by fixed-step updates
         
         while self.running:
             # Handle Pygame events
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
+                    self.game.flush_high_score()
                     return 'exit'
+                elif event.type in (pygame.VIDEOEXPOSE, pygame.VIDEORESIZE):
+                    # Window contents were lost or resized: repaint everything next frame
+                    self.game.invalidate()
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_SPACE:
                         if self.game.handle_jump():
@@ -321,13 +366,18 @@ class FlappyBirdController:
                             background = self.game.screen.copy()
                             result = pause_menu.run(background)
                             
+                            if result in ('main_menu', 'exit'):
+                                # Leaving mid-run: keep a new record that hasn't been saved yet
+                                self.game.flush_high_score()
                             if result == 'main_menu':
                                 self.running = False
                                 return 'main_menu'
                             elif result == 'exit':
                                 self.running = False
                                 return 'exit'
-                            # If 'resume', continue game loop
+                            # If 'resume', continue game loop (pause menu drew over the screen)
+                            self.game.invalidate()
+                            clock.tick()  # Don't simulate the time spent paused
                         except Exception as e:
                             print(f"Error showing pause menu: {e}")
                             import traceback
@@ -336,11 +386,27 @@ class FlappyBirdController:
             # Process hand gesture control
             if self.use_hand_control and self.cap is not None:
                 self.frame_counter += 1
-                if self.frame_counter % self.frame_skip == 0:
+                if self.game.game_over:
+                    # Gestures do nothing on the game over screen (only R restarts),
+                    # so skip detection and just refresh the webcam preview now and then
+                    if self.last_hand_positions or self.game.detected_hands_info:
+                        # Forget the hands seen at the crash: after a restart, gestures are
+                        # judged from fresh positions rather than where the hands were then
+                        self.last_hand_positions.clear()
+                        self.jump_cooldown = 0
+                        self.game.set_detected_hands([], self._next_hand_map[self.last_jump_hand], False)
+                    # Grab every tick so the camera's frame queue doesn't fill with stale
+                    # frames, but only decode the ones shown in the preview
+                    if self.cap.grab() and self.frame_counter % self.idle_preview_interval == 0:
+                        ret, frame = self.cap.retrieve()
+                        if ret:
+                            frame = self._mirror_frame(frame)
+                            self.game.set_webcam_frame(self._frame_to_surface(frame))
+                elif self.frame_counter % self.frame_skip == 0:
                     ret, frame = self.cap.read()
                     if ret:
                         # Flip frame horizontally for mirror effect
-                        frame = cv2.flip(frame, 1)
+                        frame = self._mirror_frame(frame)
                         # Detect hands first
                         hands_raw = self.hand_detector.detect_hands(frame)
                         
@@ -387,22 +453,14 @@ class FlappyBirdController:
                         
                         hands = final_hands
                         
-                        # Draw detections on frame
-                        frame_with_boxes = self.hand_detector.draw_detections(frame, hands)
+                        # Draw detections on frame (in place, the undrawn frame isn't needed again)
+                        frame_with_boxes = self.hand_detector.draw_detections(frame, hands, in_place=True)
                         
                         # Convert to Pygame surface and update game
-                        frame_rgb = cv2.cvtColor(frame_with_boxes, cv2.COLOR_BGR2RGB)
-                        frame_surface = pygame.image.frombuffer(frame_rgb.tobytes(), frame_rgb.shape[1::-1], "RGB")
-                        self.game.set_webcam_frame(frame_surface)
+                        self.game.set_webcam_frame(self._frame_to_surface(frame_with_boxes))
                         
                         # Determine which hand should jump next (for alternating)
-                        next_hand = None
-                        if self.last_jump_hand == 'Left':
-                            next_hand = 'Right'
-                        elif self.last_jump_hand == 'Right':
-                            next_hand = 'Left'
-                        else:
-                            next_hand = 'Either'  # First jump, any hand is ok
+                        next_hand = self._next_hand_map[self.last_jump_hand]
                         
                         # Update game with detected hands info and next hand
                         self.game.set_detected_hands(hands, next_hand, hands_corrected)
@@ -412,11 +470,17 @@ class FlappyBirdController:
                             if self.game.handle_jump():
                                 self.sound_manager.play_jump_sound()
             
-            # Update game
-            self.game.update()
+            # Update game in fixed steps so physics speed doesn't depend on the frame rate
+            while accumulator >= self.fixed_dt:
+                self.game.update()
+                accumulator -= self.fixed_dt
             
-            # Draw game
-            self.game.draw()
+            # Draw game every frame during play so the bird and pipes are drawn at the
+            # current interpolation point even when no fixed step ran this frame
+            # (the start and game over screens are static between state changes)
+            playing = self.game.game_started and not self.game.game_over
+            if playing or self.game.needs_redraw:
+                self.game.draw(accumulator / self.fixed_dt)
             
             # Start background music when game starts
             if self.game.game_started and not self.sound_manager.music_playing:
@@ -425,7 +489,7 @@ class FlappyBirdController:
             # Play background music
             self.sound_manager.update()
             
-            clock.tick(60)
+            accumulator += min(clock.tick(60) / 1000.0, self.max_frame_time)
         
         # Cleanup
         if self.cap is not None:
@@ -3,10 +3,13 @@ import random
 import json
 import os
 import sys
+from collections import deque
 from typing import Optional
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 
 # Initialize Pygame
+# Nothing is rasterized at import time: fonts and surfaces are created in Game.__init__,
+# after set_mode, so they can be converted to the display's pixel format.
 pygame.init()
 
 # Constants
@@ -19,6 +22,8 @@ PIPE_GAP = 150
 PIPE_SPEED = 3
 PIPE_SPAWN_RATE = 90  # frames between pipe spawns
 GROUND_HEIGHT = 100
+PIPE_POOL_SIZE = 4  # Pipes are recycled; at most 4 are on screen at PIPE_SPEED/PIPE_SPAWN_RATE
+WEBCAM_PREVIEW_SIZE = (120, 90)  # Webcam thumbnail in the bottom-right corner
 
 # Asset Path
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
@@ -33,15 +38,26 @@ YELLOW = (255, 255, 0)
 ORANGE = (255, 165, 0)
 BROWN = (139, 69, 19)
 
+# Outline offsets for HUD text
+OUTLINE_THICK = [(dx, dy) for dx in range(-2, 3) for dy in range(-2, 3) if dx != 0 or dy != 0]
+OUTLINE_CORNERS = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+
+# Grass tuft segments along the top of the ground (start, end)
+GRASS_TUFTS = [((i, SCREEN_HEIGHT - GROUND_HEIGHT), (i + 10, SCREEN_HEIGHT - GROUND_HEIGHT - 10))
+               for i in range(0, SCREEN_WIDTH, 20)]
+
 
 class Bird:
     def __init__(self, x, y):
         self.x = x
         self.y = y
+        self.prev_y = y  # Position before the last update(), for render interpolation
         self.velocity = 0
         self.radius = 15
         self.rotation = 0
         self.image = None
+        # Hitbox, moved in update() rather than rebuilt on every get_rect() call
+        self._rect = pygame.Rect(x - self.radius, y - self.radius, self.radius * 2, self.radius * 2)
         
         # Try to load custom bird image
         image_path = os.path.join("assets", "bird.png")
@@ -61,33 +77,40 @@ class Bird:
                 print(f"Could not load bird image: {e}")
         
     def update(self):
+        self.prev_y = self.y
         self.velocity += GRAVITY
         self.y += self.velocity
+        self._rect.y = int(self.y - self.radius)
         
-        # Rotation based on velocity
-        self.rotation = min(max(self.velocity * 3, -30), 90)
+        # Rotation based on velocity, clamped to [-30, 90] degrees
+        rotation = self.velocity * 3
+        self.rotation = -30 if rotation < -30 else (90 if rotation > 90 else rotation)
         
     def jump(self):
         self.velocity = JUMP_STRENGTH
         
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         if self.image:
              # Rotate image
              rotated_image = pygame.transform.rotate(self.image, -self.rotation) # Negative rotation for correct visual direction
-             rect = rotated_image.get_rect(center=(int(self.x), int(self.y)))
-             screen.blit(rotated_image, rect)
-             return
+             # Interpolate between the last two simulated positions
+             y = self.prev_y + (self.y - self.prev_y) * alpha
+             rect = rotated_image.get_rect(center=(int(self.x), int(y)))
+             return screen.blit(rotated_image, rect)
         
     def get_rect(self):
-        return pygame.Rect(self.x - self.radius, self.y - self.radius, 
-                          self.radius * 2, self.radius * 2)
+        return self._rect
 
 
 class Pipe:
     def __init__(self, x):
-        self.x = x
-        self.gap_y = random.randint(150, SCREEN_HEIGHT - GROUND_HEIGHT - 150)
-        self.passed = False
+        # Collision rects and column surface are allocated once and refilled by reset(),
+        # so Game can recycle pipes instead of creating new ones
+        self._top_rect = pygame.Rect(0, 0, PIPE_WIDTH, 0)
+        self._bottom_rect = pygame.Rect(0, 0, PIPE_WIDTH, 0)
+        # Column is 5px wider on each side to fit the caps
+        self.surface = pygame.Surface((PIPE_WIDTH + 10, SCREEN_HEIGHT - GROUND_HEIGHT),
+                                      pygame.SRCALPHA).convert_alpha()
         
         # Static storage for pipe images to avoid reloading
         if not hasattr(Pipe, 'pipe_img'):
@@ -103,89 +126,106 @@ class Pipe:
                 except Exception as e:
                     print(f"Could not load pipe image: {e}")
         
+        self.reset(x)
+        
+    def reset(self, x):
+        """Place the pipe at x with a new random gap."""
+        self.x = x
+        self.gap_y = random.randint(150, SCREEN_HEIGHT - GROUND_HEIGHT - 150)
+        # Vertical extent of the opening, used by check_collision
+        self.gap_top = self.gap_y - PIPE_GAP // 2
+        self.gap_bottom = self.gap_y + PIPE_GAP // 2
+        self.passed = False
+        # Only x changes after this, so update() just shifts the rects
+        self._top_rect.update(x, 0, PIPE_WIDTH, self.gap_top)
+        self._bottom_rect.update(x, self.gap_bottom, PIPE_WIDTH,
+                                 SCREEN_HEIGHT - GROUND_HEIGHT - self.gap_bottom)
+        self._build_surface()
+        
     def update(self):
         self.x -= PIPE_SPEED
+        self._top_rect.x = self._bottom_rect.x = self.x
         
-    def draw(self, screen):
-        if hasattr(Pipe, 'pipe_img') and Pipe.pipe_img:
+    def _build_surface(self):
+        """Pre-render the whole pipe column (both pipes + caps) for the current gap."""
+        self.surface.fill((0, 0, 0, 0))
+        top_height = self.gap_y - PIPE_GAP // 2
+        bottom_y = self.gap_y + PIPE_GAP // 2
+        bottom_height = SCREEN_HEIGHT - GROUND_HEIGHT - bottom_y
+        
+        if Pipe.pipe_img:
             # Draw using images
-            
-            # Bottom Pipe
-            # Calculate visible height for bottom pipe
-            bottom_y = self.gap_y + PIPE_GAP // 2
-            bottom_height = SCREEN_HEIGHT - GROUND_HEIGHT - bottom_y
-            
-            # Handle bottom pipe
-            # We crop the pipe image or scale it? 
-            # Standard flappy bird pipes have a cap at top.
-            # Let's simple-scale the whole image to the rect for now to fit any user image.
-            # A more advanced way is to slice the cap, but user might provide anything.
-            # Let's try to keep aspect ratio of cap if possible, but stretching is easiest "just works" logic.
-            # Better visual: Tile the body, Draw cap. But we don't know capping.
-            # Simple approach: Scale simple.
-            
+            # Simple approach: scale the whole image to each pipe so any user image "just works"
             bottom_pipe_surface = pygame.transform.scale(Pipe.pipe_img, (PIPE_WIDTH, bottom_height))
-            screen.blit(bottom_pipe_surface, (self.x, bottom_y))
+            self.surface.blit(bottom_pipe_surface, (5, bottom_y))
             
-            # Top Pipe
-            top_height = self.gap_y - PIPE_GAP // 2
+            # Top Pipe, flipped vertically
             top_pipe_surface = pygame.transform.scale(Pipe.pipe_img, (PIPE_WIDTH, top_height))
-            # Flip vertically for the top pipe
             top_pipe_surface = pygame.transform.flip(top_pipe_surface, False, True)
-            screen.blit(top_pipe_surface, (self.x, 0))
-            
+            self.surface.blit(top_pipe_surface, (5, 0))
         else:
             # Top pipe
-            top_rect = pygame.Rect(self.x, 0, PIPE_WIDTH, self.gap_y - PIPE_GAP // 2)
-            pygame.draw.rect(screen, GREEN, top_rect)
-            pygame.draw.rect(screen, BLACK, top_rect, 3)
+            top_rect = pygame.Rect(5, 0, PIPE_WIDTH, top_height)
+            pygame.draw.rect(self.surface, GREEN, top_rect)
+            pygame.draw.rect(self.surface, BLACK, top_rect, 3)
             
             # Bottom pipe
-            bottom_y = self.gap_y + PIPE_GAP // 2
-            bottom_rect = pygame.Rect(self.x, bottom_y, PIPE_WIDTH, 
-                                      SCREEN_HEIGHT - GROUND_HEIGHT - bottom_y)
-            pygame.draw.rect(screen, GREEN, bottom_rect)
-            pygame.draw.rect(screen, BLACK, bottom_rect, 3)
+            bottom_rect = pygame.Rect(5, bottom_y, PIPE_WIDTH, bottom_height)
+            pygame.draw.rect(self.surface, GREEN, bottom_rect)
+            pygame.draw.rect(self.surface, BLACK, bottom_rect, 3)
             
             # Pipe caps
             cap_width = PIPE_WIDTH + 10
-            top_cap = pygame.Rect(self.x - 5, self.gap_y - PIPE_GAP // 2 - 20, 
-                                 cap_width, 20)
-            bottom_cap = pygame.Rect(self.x - 5, self.gap_y + PIPE_GAP // 2, 
-                                     cap_width, 20)
-            pygame.draw.rect(screen, GREEN, top_cap)
-            pygame.draw.rect(screen, BLACK, top_cap, 3)
-            pygame.draw.rect(screen, GREEN, bottom_cap)
-            pygame.draw.rect(screen, BLACK, bottom_cap, 3)
+            top_cap = pygame.Rect(0, top_height - 20, cap_width, 20)
+            bottom_cap = pygame.Rect(0, bottom_y, cap_width, 20)
+            pygame.draw.rect(self.surface, GREEN, top_cap)
+            pygame.draw.rect(self.surface, BLACK, top_cap, 3)
+            pygame.draw.rect(self.surface, GREEN, bottom_cap)
+            pygame.draw.rect(self.surface, BLACK, bottom_cap, 3)
+        
+    def draw(self, screen, alpha=1.0):
+        # Interpolate between the previous position (x + PIPE_SPEED) and the current one
+        return screen.blit(self.surface, (int(self.x + PIPE_SPEED * (1 - alpha)) - 5, 0))
         
     def get_rects(self):
-        top_rect = pygame.Rect(self.x, 0, PIPE_WIDTH, self.gap_y - PIPE_GAP // 2)
-        bottom_y = self.gap_y + PIPE_GAP // 2
-        bottom_rect = pygame.Rect(self.x, bottom_y, PIPE_WIDTH, 
-                                  SCREEN_HEIGHT - GROUND_HEIGHT - bottom_y)
-        return [top_rect, bottom_rect]
+        return [self._top_rect, self._bottom_rect]
     
     def check_collision(self, bird_rect):
-        for rect in self.get_rects():
-            if bird_rect.colliderect(rect):
-                return True
-        return False
+        # Same result as colliderect against both get_rects(), without building them:
+        # the bird must overlap the pipe horizontally and stick out of the gap
+        if bird_rect.right <= self.x or bird_rect.left >= self.x + PIPE_WIDTH:
+            return False
+        return bird_rect.top < self.gap_top or bird_rect.bottom > self.gap_bottom
 
 
 class Game:
     def __init__(self, sound_manager=None, fullscreen: bool = False):
         self.fullscreen = fullscreen
         if fullscreen:
-            self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+            self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN | pygame.DOUBLEBUF)
         else:
-            self.screen = pygame.display.set_mode((800, 600), pygame.RESIZABLE)
+            self.screen = pygame.display.set_mode((800, 600), pygame.RESIZABLE | pygame.DOUBLEBUF)
         pygame.display.set_caption("Flappy 67")
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 36)
         self.big_font = pygame.font.Font(None, 72)
+        self.small_font = pygame.font.Font(None, 24)
+        self.hand_info_font = self.small_font  # Same face and size, share the parsed font
+        self.next_hand_font = pygame.font.Font(None, 32)
+        self._text_cache = {}  # (text, font id, color) -> rendered Surface
+        # Dirty-rect bookkeeping: areas drawn this frame / last frame
+        self._dirty = []
+        self._prev_dirty = []
+        self._full_redraw = True
+        self._last_mode = None
+        self.needs_redraw = True  # Cleared by draw(); set whenever something visible changes
+        self._cloud_band = pygame.Rect(0, 0, SCREEN_WIDTH, 250)
         self.sound_manager = sound_manager
+        self.pipes = deque()  # Ordered oldest (leftmost) to newest
+        self._free_pipes = deque(Pipe(SCREEN_WIDTH) for _ in range(PIPE_POOL_SIZE))
         self.reset()
         self.high_score = self.load_high_score()
+        self._high_score_dirty = False
         
         # Load background
         self.background_img = None
@@ -198,9 +238,82 @@ class Game:
             except Exception as e:
                 print(f"Could not load background: {e}")
         
+        self._build_background()
+        
+        # Static strings are rendered once up front
+        self._title_surf = self.big_font.render("FLAPPY 67", True, WHITE).convert_alpha()
+        self._title_shadow = self.big_font.render("FLAPPY 67", True, BLACK).convert_alpha()
+        self._instr_surf = self.font.render("Alternate L/R Hands to Jump!", True, WHITE).convert_alpha()
+        self._instr2_surf = self.small_font.render("Wave Left, then Right, then Left...", True, WHITE).convert_alpha()
+        self._gameover_surf = self.big_font.render("GAME OVER", True, WHITE).convert_alpha()
+        self._restart_surf = self.font.render("Press R to Restart", True, WHITE).convert_alpha()
+        
+    def _render(self, text, font, color):
+        """Render text through a cache so unchanged strings are not re-rasterized every frame."""
+        key = (text, id(font), color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            if len(self._text_cache) >= 256:
+                self._text_cache.clear()
+            surface = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = surface
+        return surface
+        
+    def _make_outlined(self, text, font, color, offsets=OUTLINE_CORNERS, outline=BLACK):
+        """
+        Pre-composite text with its black outline into one cached surface.
+        The text sits at (pad, pad) where pad is the largest outline offset,
+        so blit the result at (x - pad, y - pad).
+        """
+        key = (text, id(font), color, len(offsets))
+        surface = self._text_cache.get(key)
+        if surface is None:
+            pad = max(max(abs(dx), abs(dy)) for dx, dy in offsets)
+            text_surf = font.render(text, True, color)
+            outline_surf = font.render(text, True, outline)
+            surface = pygame.Surface((text_surf.get_width() + 2 * pad, text_surf.get_height() + 2 * pad),
+                                     pygame.SRCALPHA).convert_alpha()
+            for dx, dy in offsets:
+                surface.blit(outline_surf, (pad + dx, pad + dy))
+            surface.blit(text_surf, (pad, pad))
+            if len(self._text_cache) >= 256:
+                self._text_cache.clear()
+            self._text_cache[key] = surface
+        return surface
+        
+    def _build_background(self):
+        """Pre-render the static sky + ground layer and the scrolling cloud strip."""
+        self.bg_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.cloud_strip = None
+        if self.background_img:
+            self.bg_surface.blit(self.background_img, (0, 0))
+        else:
+            self.bg_surface.fill(SKY_BLUE)
+            
+            # Clouds (simple circles) on a transparent strip one wrap period wide
+            self.cloud_strip = pygame.Surface((SCREEN_WIDTH + 100, 250), pygame.SRCALPHA).convert_alpha()
+            for i in range(3):
+                x = i * 150 + 50
+                y = 50 + i * 80
+                pygame.draw.circle(self.cloud_strip, WHITE, (x, y), 30)
+                pygame.draw.circle(self.cloud_strip, WHITE, (x + 20, y), 35)
+                pygame.draw.circle(self.cloud_strip, WHITE, (x + 40, y), 30)
+        
+        # Ground
+        ground_rect = pygame.Rect(0, SCREEN_HEIGHT - GROUND_HEIGHT, SCREEN_WIDTH, GROUND_HEIGHT)
+        pygame.draw.rect(self.bg_surface, BROWN, ground_rect)
+        pygame.draw.line(self.bg_surface, BLACK, (0, SCREEN_HEIGHT - GROUND_HEIGHT), 
+                        (SCREEN_WIDTH, SCREEN_HEIGHT - GROUND_HEIGHT), 3)
+        
+        # Grass on ground (rasterized once into the cached background)
+        for start, end in GRASS_TUFTS:
+            pygame.draw.line(self.bg_surface, GREEN, start, end, 2)
+        
     def reset(self):
         self.bird = Bird(SCREEN_WIDTH // 4, SCREEN_HEIGHT // 2)
-        self.pipes = []
+        self._free_pipes.extend(self.pipes)
+        self.pipes.clear()
+        self._scored_pipes = 0  # Number of pipes at the front of self.pipes already passed
         self.score = 0
         self.game_over = False
         self.game_started = False
@@ -209,6 +322,9 @@ class Game:
         self.detected_hands_info = None  # Store hand detection info for display
         self.next_jump_hand = 'Either'  # Which hand should jump next (for alternating)
         self.hands_corrected = False  # Whether hands were auto-corrected
+        self._hud_surf = None  # Cached hand status HUD, see _build_hud()
+        self._hud_key = None
+        self.needs_redraw = True
         
     def load_high_score(self):
         try:
@@ -220,6 +336,12 @@ class Game:
             pass
         return 0
     
+    def flush_high_score(self):
+        """Save the high score if it changed since the last save."""
+        if self._high_score_dirty:
+            self.save_high_score()
+            self._high_score_dirty = False
+    
     def save_high_score(self):
         try:
             with open('high_scores.json', 'w') as f:
@@ -228,13 +350,26 @@ class Game:
             pass
     
     def set_webcam_frame(self, surface):
+        # Scale to the thumbnail size once per camera frame (not once per draw) and convert
+        # to the display format so the blit in draw() needs no per-pixel conversion
+        if surface is not None:
+            surface = pygame.transform.scale(surface, WEBCAM_PREVIEW_SIZE).convert()
         self.webcam_surface = surface
+        self.needs_redraw = True
     
     def set_detected_hands(self, hands_info, next_hand=None, corrected=False):
         """Store information about detected hands for display."""
         self.detected_hands_info = hands_info
         self.next_jump_hand = next_hand  # Which hand should jump next
         self.hands_corrected = corrected  # Whether hands were reassigned
+        self.needs_redraw = True
+        
+        # Only re-render the HUD when something it shows has changed
+        hud_key = (next_hand, corrected,
+                   tuple((h.get('handedness'), round(h.get('confidence', 0), 2)) for h in hands_info))
+        if hud_key != self._hud_key:
+            self._hud_key = hud_key
+            self._hud_surf = None
     
     def handle_jump(self):
         if not self.game_over:
@@ -242,6 +377,7 @@ class Game:
                 self.game_started = True
                 self.sound_manager.start_background_music("background.mp3")
             self.bird.jump()
+            self.needs_redraw = True
             return True
         return False
     
@@ -250,29 +386,41 @@ class Game:
             return
             
         self.frame_count += 1
+        self.needs_redraw = True  # Bird, pipes and clouds move every tick
         self.bird.update()
         
         # Spawn pipes
         if self.frame_count % PIPE_SPAWN_RATE == 0:
-            self.pipes.append(Pipe(SCREEN_WIDTH))
+            if self._free_pipes:
+                pipe = self._free_pipes.popleft()
+                pipe.reset(SCREEN_WIDTH)
+            else:
+                pipe = Pipe(SCREEN_WIDTH)
+            self.pipes.append(pipe)
         
         # Update pipes
-        for pipe in self.pipes[:]:
+        for pipe in self.pipes:
             pipe.update()
-            
-            # Check if bird passed pipe
-            if not pipe.passed and pipe.x + PIPE_WIDTH < self.bird.x:
+        
+        # Check if bird passed a pipe. Passed pipes always form a prefix of the
+        # deque, so only the oldest unscored pipe needs testing.
+        if self._scored_pipes < len(self.pipes):
+            pipe = self.pipes[self._scored_pipes]
+            if pipe.x + PIPE_WIDTH < self.bird.x:
                 pipe.passed = True
+                self._scored_pipes += 1
                 self.score += 1
                 if self.sound_manager:
                     self.sound_manager.play_score_sound()
                 if self.score > self.high_score:
+                    # Written to disk on game over, not on every pipe of a streak
                     self.high_score = self.score
-                    self.save_high_score()
-            
-            # Remove off-screen pipes
-            if pipe.x + PIPE_WIDTH < 0:
-                self.pipes.remove(pipe)
+                    self._high_score_dirty = True
+        
+        # Remove off-screen pipes (only ever the oldest, already scored ones)
+        while self.pipes and self.pipes[0].x + PIPE_WIDTH < 0:
+            self._free_pipes.append(self.pipes.popleft())
+            self._scored_pipes -= 1
         
         # Check collisions
         bird_rect = self.bird.get_rect()
@@ -280,81 +428,186 @@ class Game:
         # Ground and ceiling collision
         if (self.bird.y + self.bird.radius >= SCREEN_HEIGHT - GROUND_HEIGHT or 
             self.bird.y - self.bird.radius <= 0):
-            if self.sound_manager:
-                self.sound_manager.play_hit_sound()
-            self.game_over = True
+            self._crash()
             return
         
-        # Pipe collision
-        for pipe in self.pipes:
-            if pipe.check_collision(bird_rect):
-                if self.sound_manager:
-                    self.sound_manager.play_hit_sound()
-                self.game_over = True
+        # Pipe collision. Pipes are spaced far wider than the bird, so only the
+        # most recently passed pipe (still under the bird's tail) and the next
+        # unpassed one can overlap it.
+        first = max(self._scored_pipes - 1, 0)
+        last = min(self._scored_pipes + 1, len(self.pipes))
+        for i in range(first, last):
+            if self.pipes[i].check_collision(bird_rect):
+                self._crash()
                 return
     
-    def draw(self):
-        # Draw sky background
-        if self.background_img:
-            self.screen.blit(self.background_img, (0, 0))
-        else:
-            self.screen.fill(SKY_BLUE)
+    def _crash(self):
+        if self.sound_manager:
+            self.sound_manager.play_hit_sound()
+        self.game_over = True
+        self.flush_high_score()
+    
+    def _blit(self, surface, pos):
+        """Blit onto the screen and record the touched area as dirty."""
+        rect = self.screen.blit(surface, pos)
+        self._dirty.append(rect)
+        return rect
+    
+    def invalidate(self):
+        """Force the next draw() to repaint and present the whole screen."""
+        self._full_redraw = True
+        self.needs_redraw = True
+    
+    def _build_hud(self):
+        """Render the hand detection status block into a single surface."""
+        items = []  # (surface, position) pairs
+        y_offset = 10
+        
+        # Show which hand should jump next (BIG and BOLD)
+        if self.next_jump_hand:
+            if self.next_jump_hand == 'Either':
+                next_text = "Wave Either Hand!"
+                next_color = (255, 255, 100)  # Yellow
+            elif self.next_jump_hand == 'Left':
+                next_text = "Wave LEFT Hand! 👈"
+                next_color = (100, 150, 255)  # Blue
+            else:  # Right
+                next_text = "Wave RIGHT Hand! 👉"
+                next_color = (255, 100, 100)  # Red
             
-            # Draw clouds (simple circles)
-            for i in range(3):
-                x = (i * 150 + self.frame_count // 2) % (SCREEN_WIDTH + 100) - 50
-                y = 50 + i * 80
-                pygame.draw.circle(self.screen, WHITE, (x, y), 30)
-                pygame.draw.circle(self.screen, WHITE, (x + 20, y), 35)
-                pygame.draw.circle(self.screen, WHITE, (x + 40, y), 30)
+            # Thick black outline for emphasis
+            next_hand_text = self._make_outlined(next_text, self.next_hand_font, next_color, OUTLINE_THICK)
+            items.append((next_hand_text, (10 - 2, y_offset - 2)))
+            y_offset += 40
+        
+        # Count detected left and right hands
+        left_count = sum(1 for h in self.detected_hands_info if h.get('handedness') == 'Left')
+        right_count = sum(1 for h in self.detected_hands_info if h.get('handedness') == 'Right')
+        
+        # Show correction status if hands were reassigned
+        if self.hands_corrected:
+            hands_status = f"Hands: L={left_count} R={right_count} [Auto-corrected by position]"
+            status_color = (255, 200, 100)  # Orange for corrected
+        else:
+            hands_status = f"Hands: L={left_count} R={right_count}"
+            status_color = (180, 180, 180)  # Gray for normal
+        
+        status_text = self._make_outlined(hands_status, self.hand_info_font, status_color)
+        items.append((status_text, (10 - 1, y_offset - 1)))
+        y_offset += 25
+        
+        if len(self.detected_hands_info) > 0:
+            for hand in self.detected_hands_info:
+                handedness = hand.get('handedness', 'Hand')
+                confidence = hand.get('confidence', 0)
+                
+                # Check if this is a dummy hand (0% confidence)
+                is_dummy = confidence == 0.0
+                
+                # Choose color based on handedness
+                if handedness == 'Left':
+                    color = (100, 100, 255) if not is_dummy else (80, 80, 180)  # Light blue for left, darker if dummy
+                elif handedness == 'Right':
+                    color = (255, 100, 100) if not is_dummy else (180, 80, 80)  # Light red for right, darker if dummy
+                else:
+                    color = (100, 255, 100)  # Light green for unknown
+                
+                # Highlight the hand that should jump next
+                if handedness == self.next_jump_hand:
+                    color = (255, 255, 0)  # Bright yellow for active hand
+                    text = f">>> {handedness} Hand: {confidence:.0%}" + (" [No Detection]" if is_dummy else "") + " <<<"
+                else:
+                    text = f"{handedness} Hand: {confidence:.0%}" + (" [No Detection]" if is_dummy else "")
+                
+                # Black outline for better visibility
+                hand_text = self._make_outlined(text, self.hand_info_font, color)
+                items.append((hand_text, (10 - 1, y_offset - 1)))
+                y_offset += 25
+        else:
+            # No hands detected
+            text = "No hands detected"
+            no_hand_text = self._make_outlined(text, self.hand_info_font, (200, 200, 200))
+            items.append((no_hand_text, (10 - 1, 10 - 1)))
+        
+        # Composite everything onto one transparent surface anchored at the screen origin
+        width = max(pos[0] + surf.get_width() for surf, pos in items)
+        height = max(pos[1] + surf.get_height() for surf, pos in items)
+        hud = pygame.Surface((width, height), pygame.SRCALPHA).convert_alpha()
+        for surf, pos in items:
+            hud.blit(surf, pos)
+        return hud
+    
+    def draw(self, alpha=1.0):
+        """
+        Draw the current frame.
+        
+        Args:
+            alpha: Fraction of a simulation step elapsed since the last update(),
+                   used to interpolate moving sprites (1.0 = latest state)
+        """
+        if self.game_over:
+            alpha = 1.0  # Nothing moves any more, show where the bird crashed
+        
+        # Start/game over screens (and any mode switch) repaint everything;
+        # during play only the areas sprites covered last frame are restored
+        mode = (self.game_started, self.game_over)
+        full = self._full_redraw or mode != self._last_mode or not self.game_started or self.game_over
+        self._last_mode = mode
+        self._full_redraw = False
+        self.needs_redraw = False
+        
+        if full:
+            # Draw pre-rendered sky + ground
+            self.screen.blit(self.bg_surface, (0, 0))
+        else:
+            # Erase last frame's sprites by restoring the background underneath
+            for rect in self._prev_dirty:
+                self.screen.blit(self.bg_surface, rect, rect)
+        
+        # Scroll the cloud strip, blitting it twice so it wraps around
+        if self.cloud_strip is not None:
+            if not full:
+                self._dirty.append(self.screen.blit(self.bg_surface, self._cloud_band, self._cloud_band))
+            period = SCREEN_WIDTH + 100
+            cloud_x = (self.frame_count // 2) % period - 100
+            self._blit(self.cloud_strip, (cloud_x, 0))
+            self._blit(self.cloud_strip, (cloud_x - period, 0))
         
         if self.game_started:
             # Draw pipes
             for pipe in self.pipes:
-                pipe.draw(self.screen)
+                self._dirty.append(pipe.draw(self.screen, alpha))
             
             # Draw bird
-            self.bird.draw(self.screen)
+            bird_rect = self.bird.draw(self.screen, alpha)
+            if bird_rect:
+                self._dirty.append(bird_rect)
             
             # Draw score
-            score_text = self.font.render(str(self.score), True, WHITE)
+            score_text = self._render(str(self.score), self.font, WHITE)
             score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, 50))
             # Add shadow
-            shadow_text = self.font.render(str(self.score), True, BLACK)
+            shadow_text = self._render(str(self.score), self.font, BLACK)
             shadow_rect = shadow_text.get_rect(center=(SCREEN_WIDTH // 2 + 2, 52))
-            self.screen.blit(shadow_text, shadow_rect)
-            self.screen.blit(score_text, score_rect)
+            self._blit(shadow_text, shadow_rect)
+            self._blit(score_text, score_rect)
         else:
             # Draw start screen
-            start_text = self.big_font.render("FLAPPY 67", True, WHITE)
-            start_rect = start_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
-            shadow_text = self.big_font.render("FLAPPY 67", True, BLACK)
-            shadow_rect = shadow_text.get_rect(center=(SCREEN_WIDTH // 2 + 3, SCREEN_HEIGHT // 2 - 47))
-            self.screen.blit(shadow_text, shadow_rect)
-            self.screen.blit(start_text, start_rect)
+            start_rect = self._title_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
+            shadow_rect = self._title_shadow.get_rect(center=(SCREEN_WIDTH // 2 + 3, SCREEN_HEIGHT // 2 - 47))
+            self._blit(self._title_shadow, shadow_rect)
+            self._blit(self._title_surf, start_rect)
             
-            instruction_text = self.font.render("Alternate L/R Hands to Jump!", True, WHITE)
-            inst_rect = instruction_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
-            self.screen.blit(instruction_text, inst_rect)
+            inst_rect = self._instr_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
+            self._blit(self._instr_surf, inst_rect)
             
-            instruction_text2 = pygame.font.Font(None, 24).render("Wave Left, then Right, then Left...", True, WHITE)
-            inst_rect2 = instruction_text2.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 80))
-            self.screen.blit(instruction_text2, inst_rect2)
+            inst_rect2 = self._instr2_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 80))
+            self._blit(self._instr2_surf, inst_rect2)
             
             # Draw bird at start position
-            self.bird.draw(self.screen)
-        
-        # Draw ground
-        ground_rect = pygame.Rect(0, SCREEN_HEIGHT - GROUND_HEIGHT, SCREEN_WIDTH, GROUND_HEIGHT)
-        pygame.draw.rect(self.screen, BROWN, ground_rect)
-        pygame.draw.line(self.screen, BLACK, (0, SCREEN_HEIGHT - GROUND_HEIGHT), 
-                        (SCREEN_WIDTH, SCREEN_HEIGHT - GROUND_HEIGHT), 3)
-        
-        # Draw grass on ground
-        for i in range(0, SCREEN_WIDTH, 20):
-            pygame.draw.line(self.screen, GREEN, 
-                           (i, SCREEN_HEIGHT - GROUND_HEIGHT),
-                           (i + 10, SCREEN_HEIGHT - GROUND_HEIGHT - 10), 2)
+            bird_rect = self.bird.draw(self.screen)
+            if bird_rect:
+                self._dirty.append(bird_rect)
         
         if self.game_over:
             # Draw game over screen
@@ -363,120 +616,41 @@ class Game:
             overlay.fill(BLACK)
             self.screen.blit(overlay, (0, 0))
             
-            game_over_text = self.big_font.render("GAME OVER", True, WHITE)
-            go_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 100))
-            self.screen.blit(game_over_text, go_rect)
+            go_rect = self._gameover_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 100))
+            self._blit(self._gameover_surf, go_rect)
             
-            score_text = self.font.render(f"Score: {self.score}", True, WHITE)
+            score_text = self._render(f"Score: {self.score}", self.font, WHITE)
             score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 30))
-            self.screen.blit(score_text, score_rect)
+            self._blit(score_text, score_rect)
             
-            high_score_text = self.font.render(f"High Score: {self.high_score}", True, WHITE)
+            high_score_text = self._render(f"High Score: {self.high_score}", self.font, WHITE)
             hs_rect = high_score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 10))
-            self.screen.blit(high_score_text, hs_rect)
+            self._blit(high_score_text, hs_rect)
             
-            restart_text = self.font.render("Press R to Restart", True, WHITE)
-            restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 60))
-            self.screen.blit(restart_text, restart_rect)
+            restart_rect = self._restart_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 60))
+            self._blit(self._restart_surf, restart_rect)
         
         # Draw webcam feed if available
         if self.webcam_surface:
-            # Scale to reasonable size (e.g., 25% of width)
-            w = 120
-            h = 90
-            scaled_surface = pygame.transform.scale(self.webcam_surface, (w, h))
+            # Already scaled in set_webcam_frame
+            w, h = WEBCAM_PREVIEW_SIZE
             # Position in bottom-right corner
-            self.screen.blit(scaled_surface, (SCREEN_WIDTH - w - 10, SCREEN_HEIGHT - h - 10))
+            self._blit(self.webcam_surface, (SCREEN_WIDTH - w - 10, SCREEN_HEIGHT - h - 10))
             # Draw border
-            pygame.draw.rect(self.screen, BLACK, (SCREEN_WIDTH - w - 10, SCREEN_HEIGHT - h - 10, w, h), 2)
+            self._dirty.append(pygame.draw.rect(self.screen, BLACK, (SCREEN_WIDTH - w - 10, SCREEN_HEIGHT - h - 10, w, h), 2))
         
-        # Draw hand detection status
+        # Draw hand detection status (rebuilt only when the displayed hand state changes)
         if self.detected_hands_info is not None:
-            hand_info_font = pygame.font.Font(None, 24)
-            next_hand_font = pygame.font.Font(None, 32)
-            y_offset = 10
-            
-            # Show which hand should jump next (BIG and BOLD)
-            if hasattr(self, 'next_jump_hand') and self.next_jump_hand:
-                if self.next_jump_hand == 'Either':
-                    next_text = "Wave Either Hand!"
-                    next_color = (255, 255, 100)  # Yellow
-                elif self.next_jump_hand == 'Left':
-                    next_text = "Wave LEFT Hand! 👈"
-                    next_color = (100, 150, 255)  # Blue
-                else:  # Right
-                    next_text = "Wave RIGHT Hand! 👉"
-                    next_color = (255, 100, 100)  # Red
-                
-                next_hand_text = next_hand_font.render(next_text, True, next_color)
-                # Add thick black outline for emphasis
-                outline_text = next_hand_font.render(next_text, True, BLACK)
-                for dx in [-2, -1, 0, 1, 2]:
-                    for dy in [-2, -1, 0, 1, 2]:
-                        if dx != 0 or dy != 0:
-                            self.screen.blit(outline_text, (10 + dx, y_offset + dy))
-                self.screen.blit(next_hand_text, (10, y_offset))
-                y_offset += 40
-            
-            # Count detected left and right hands
-            left_count = sum(1 for h in self.detected_hands_info if h.get('handedness') == 'Left')
-            right_count = sum(1 for h in self.detected_hands_info if h.get('handedness') == 'Right')
-            
-            # Show correction status if hands were reassigned
-            if hasattr(self, 'hands_corrected') and self.hands_corrected:
-                hands_status = f"Hands: L={left_count} R={right_count} [Auto-corrected by position]"
-                status_color = (255, 200, 100)  # Orange for corrected
-            else:
-                hands_status = f"Hands: L={left_count} R={right_count}"
-                status_color = (180, 180, 180)  # Gray for normal
-            
-            status_text = hand_info_font.render(hands_status, True, status_color)
-            outline_text = hand_info_font.render(hands_status, True, BLACK)
-            for dx, dy in [(-1,-1), (-1,1), (1,-1), (1,1)]:
-                self.screen.blit(outline_text, (10 + dx, y_offset + dy))
-            self.screen.blit(status_text, (10, y_offset))
-            y_offset += 25
-            
-            if len(self.detected_hands_info) > 0:
-                for hand in self.detected_hands_info:
-                    handedness = hand.get('handedness', 'Hand')
-                    confidence = hand.get('confidence', 0)
-                    
-                    # Check if this is a dummy hand (0% confidence)
-                    is_dummy = confidence == 0.0
-                    
-                    # Choose color based on handedness
-                    if handedness == 'Left':
-                        color = (100, 100, 255) if not is_dummy else (80, 80, 180)  # Light blue for left, darker if dummy
-                    elif handedness == 'Right':
-                        color = (255, 100, 100) if not is_dummy else (180, 80, 80)  # Light red for right, darker if dummy
-                    else:
-                        color = (100, 255, 100)  # Light green for unknown
-                    
-                    # Highlight the hand that should jump next
-                    if hasattr(self, 'next_jump_hand') and handedness == self.next_jump_hand:
-                        color = (255, 255, 0)  # Bright yellow for active hand
-                        text = f">>> {handedness} Hand: {confidence:.0%}" + (" [No Detection]" if is_dummy else "") + " <<<"
-                    else:
-                        text = f"{handedness} Hand: {confidence:.0%}" + (" [No Detection]" if is_dummy else "")
-                    
-                    hand_text = hand_info_font.render(text, True, color)
-                    # Add black outline for better visibility
-                    outline_text = hand_info_font.render(text, True, BLACK)
-                    for dx, dy in [(-1,-1), (-1,1), (1,-1), (1,1)]:
-                        self.screen.blit(outline_text, (10 + dx, y_offset + dy))
-                    self.screen.blit(hand_text, (10, y_offset))
-                    y_offset += 25
-            else:
-                # No hands detected
-                text = "No hands detected"
-                no_hand_text = hand_info_font.render(text, True, (200, 200, 200))
-                outline_text = hand_info_font.render(text, True, BLACK)
-                for dx, dy in [(-1,-1), (-1,1), (1,-1), (1,1)]:
-                    self.screen.blit(outline_text, (10 + dx, 10 + dy))
-                self.screen.blit(no_hand_text, (10, 10))
-        
-        pygame.display.flip()
+            if self._hud_surf is None:
+                self._hud_surf = self._build_hud()
+            self._blit(self._hud_surf, (0, 0))
+        
+        if full:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self._prev_dirty + self._dirty)
+        self._prev_dirty = self._dirty
+        self._dirty = []
     
     def restart(self):
         self.reset()
@@ -3,9 +3,19 @@ import cv2
 import numpy as np
 import sys
 import os
+import threading
+import time
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
-from games.rhythm.game import RhythmGame
+from games.rhythm.game import RhythmGame, WEBCAM_PREVIEW_SIZE, FPS, wait_until
 from core.hand_detector import HandDetector
+from core.loading import LoadingScreen
+from ui.pause_menu import PauseMenu
+
+# Slot index of each hand in the per-hand tracking arrays
+HAND_SLOTS = {'Left': 0, 'Right': 1}
+
+# Event types the game loop reacts to; everything else is discarded unprocessed
+HANDLED_EVENTS = (pygame.QUIT, pygame.KEYDOWN, pygame.VIDEORESIZE, pygame.VIDEOEXPOSE)
 
 
 class RhythmHandController:
@@ -20,6 +30,7 @@ class RhythmHandController:
         """
         self.fullscreen = fullscreen
         self.game = RhythmGame(fullscreen=fullscreen)
+        self._screen_size = self.game.screen.get_size()  # Refreshed on mode changes and resizes
         self.use_hand_control = use_hand_control
         
         if use_hand_control:
@@ -50,22 +61,45 @@ class RhythmHandController:
                 self.cap = None
                 self.hand_detector = None
             else:
+                # MJPG keeps USB transfer/decoding cheap; must be set before the resolution
+                self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
                 # Set camera resolution for wider field of view
                 self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
                 self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
+                # Don't let the driver queue up stale frames
+                self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
         else:
             self.hand_detector = None
             self.cap = None
         
         self.running = True
-        self.last_hand_positions = {}  # Track positions per hand
+        # Per-hand tracking, indexed by HAND_SLOTS: last y position (None = not tracked)
+        # and how many consecutive detections the hand has been still
+        self._hand_y = [None, None]
+        self._hand_still = [0, 0]
         self.jump_threshold = 32  # pixels to move up to trigger gesture
-        self.frame_skip = 1  # Process every frame for better responsiveness (reduced from 2)
-        self.frame_counter = 0  # Frame counter for processing hand detection
+        self.infer_period = 1 / 30  # Seconds between hand detections (the webcam delivers ~30 fps)
+        self.max_infer_period = 1 / 15  # Slowest detection rate when detection can't keep up
+        self.slow_infer_time = 0.025  # Detections slower than this (seconds) back the rate off
         self.jump_cooldown = 0  # Cooldown counter for preventing rapid gestures
         self.jump_cooldown_frames = 3  # Cooldown period in frames (reduced from 10 for rapid notes)
         self.still_threshold = 1  # pixels - if hand moves less than this, consider it still
         self.reset_after_still_frames = 20  # Reset position after N frames of being still
+        self.detect_width = 640  # Frames are downscaled to this width for detection (None = full size)
+        
+        # Webcam frames are read on a background thread into a single slot holding
+        # only the newest frame, and hand detection runs on a second thread that
+        # publishes its newest result the same way, so the game loop never blocks
+        # on the camera or the model
+        self._frame_lock = threading.Lock()
+        self._latest_frame = None
+        self._spare_frame = None  # Finished-with frame buffer for the next capture to read into
+        self._frame_wanted = threading.Event()  # Set while the detection worker waits for a frame
+        self._result_lock = threading.Lock()
+        self._latest_result = None  # (hands, frame with detections drawn)
+        self._capture_stop = threading.Event()
+        self._threads = []
+        self._preview_visible = True  # Read by the detection worker; skip annotating frames nobody sees
     
     def toggle_fullscreen(self):
         """Toggle between fullscreen and windowed mode."""
@@ -74,6 +108,8 @@ class RhythmHandController:
             self.game.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
         else:
             self.game.screen = pygame.display.set_mode((800, 600), pygame.RESIZABLE)
+        self._screen_size = self.game.screen.get_size()
+        self.game.invalidate()
         # Note: All attributes are already initialized in __init__, no need to reset here
         
     def filter_hands(self, hands):
@@ -81,35 +117,31 @@ class RhythmHandController:
         if len(hands) == 0:
             return hands
         
-        valid_hands = [h for h in hands if h.get('handedness') in ['Left', 'Right']]
-        
-        if len(valid_hands) == 0:
-            return []
+        # Single pass: keep Left/Right hands and count the lefts
+        valid_hands = []
+        left_count = 0
+        for h in hands:
+            handedness = h.get('handedness')
+            if handedness == 'Left':
+                left_count += 1
+            elif handedness != 'Right':
+                continue
+            valid_hands.append(h)
         
-        if len(valid_hands) == 1:
+        if len(valid_hands) <= 1:
             return valid_hands
-            
-        left_hands = [h for h in valid_hands if h.get('handedness') == 'Left']
-        right_hands = [h for h in valid_hands if h.get('handedness') == 'Right']
         
-        if len(left_hands) == 1 and len(right_hands) == 1:
+        if len(valid_hands) == 2 and left_count == 1:
             return valid_hands
         
-        if len(left_hands) >= 2 or len(right_hands) >= 2:
-            sorted_hands = sorted(valid_hands, key=lambda h: h['confidence'], reverse=True)[:2]
-            sorted_hands.sort(key=lambda h: h['center'][0])
-            sorted_hands[0]['handedness'] = 'Left'
-            sorted_hands[1]['handedness'] = 'Right'
-            return sorted_hands
-        
-        if len(valid_hands) > 2:
-            sorted_hands = sorted(valid_hands, key=lambda h: h['confidence'], reverse=True)[:2]
-            sorted_hands.sort(key=lambda h: h['center'][0])
-            sorted_hands[0]['handedness'] = 'Left'
-            sorted_hands[1]['handedness'] = 'Right'
-            return sorted_hands
-        
-        return valid_hands
+        # Duplicate handedness (or more than two hands): keep the two most confident
+        # and relabel them by horizontal position
+        first, second = sorted(valid_hands, key=lambda h: h['confidence'], reverse=True)[:2]
+        if first['center'][0] > second['center'][0]:
+            first, second = second, first
+        first['handedness'] = 'Left'
+        second['handedness'] = 'Right'
+        return [first, second]
         
     def process_hand_gesture(self, hands):
         """
@@ -122,96 +154,199 @@ class RhythmHandController:
         if self.jump_cooldown > 0:
             self.jump_cooldown -= 1
         
+        hand_y = self._hand_y
+        hand_still = self._hand_still
+        
         if len(hands) == 0:
-            self.last_hand_positions.clear()
+            hand_y[0] = hand_y[1] = None
             return None
         
         gesture_hand = None
+        can_jump = self.jump_cooldown <= 0
+        jump_threshold = self.jump_threshold
+        still_threshold = self.still_threshold
+        reset_after_still_frames = self.reset_after_still_frames
         
-        if self.jump_cooldown <= 0:
-            for hand in hands:
-                center_y = hand['center'][1]
-                handedness = hand.get('handedness', 'Unknown')
-                
-                if handedness == 'Unknown':
+        for hand in hands:
+            center_y = int(hand['center'][1])
+            handedness = hand.get('handedness', 'Unknown')
+            slot = HAND_SLOTS.get(handedness)
+            
+            if slot is None:
+                continue
+            
+            last_y = hand_y[slot]
+            hand_y[slot] = center_y
+            if last_y is None:
+                # Newly seen hand: start tracking from here
+                hand_still[slot] = 0
+                continue
+            
+            # Jump checks only run outside the cooldown; still-frame tracking always runs
+            if can_jump:
+                if hand_still[slot] >= reset_after_still_frames:
+                    # Re-anchor after the hand has rested for a while
+                    hand_still[slot] = 0
                     continue
                 
-                hand_key = handedness
-                
-                if hand_key in self.last_hand_positions:
-                    hand_data = self.last_hand_positions[hand_key]
-                    last_y = hand_data['y']
-                    frames_still = hand_data.get('frames_still', 0)
-                    
-                    movement = abs(last_y - center_y)
-                    
-                    if frames_still >= self.reset_after_still_frames:
-                        self.last_hand_positions[hand_key] = {
-                            'y': center_y,
-                            'frames_still': 0
-                        }
-                        continue
-                    
-                    if last_y - center_y > self.jump_threshold:
-                        gesture_hand = handedness
-                        self.jump_cooldown = self.jump_cooldown_frames
-                        self.last_hand_positions[hand_key] = {
-                            'y': center_y,
-                            'frames_still': 0
-                        }
-                        break
-                    
-                    if movement < self.still_threshold:
-                        self.last_hand_positions[hand_key] = {
-                            'y': center_y,
-                            'frames_still': frames_still + 1
-                        }
-                    else:
-                        self.last_hand_positions[hand_key] = {
-                            'y': center_y,
-                            'frames_still': 0
-                        }
-                else:
-                    self.last_hand_positions[hand_key] = {
-                        'y': center_y,
-                        'frames_still': 0
-                    }
-        else:
-            for hand in hands:
-                center_y = hand['center'][1]
-                handedness = hand.get('handedness', 'Unknown')
-                if handedness != 'Unknown':
-                    hand_key = handedness
-                    
-                    if hand_key in self.last_hand_positions:
-                        hand_data = self.last_hand_positions[hand_key]
-                        last_y = hand_data['y']
-                        frames_still = hand_data.get('frames_still', 0)
-                        movement = abs(last_y - center_y)
-                        
-                        if movement < self.still_threshold:
-                            self.last_hand_positions[hand_key] = {
-                                'y': center_y,
-                                'frames_still': frames_still + 1
-                            }
-                        else:
-                            self.last_hand_positions[hand_key] = {
-                                'y': center_y,
-                                'frames_still': 0
-                            }
-                    else:
-                        self.last_hand_positions[hand_key] = {
-                            'y': center_y,
-                            'frames_still': 0
-                        }
+                if last_y - center_y > jump_threshold:
+                    gesture_hand = handedness
+                    self.jump_cooldown = self.jump_cooldown_frames
+                    hand_still[slot] = 0
+                    break
+            
+            if abs(last_y - center_y) < still_threshold:
+                hand_still[slot] += 1
+            else:
+                hand_still[slot] = 0
         
-        detected_keys = set(hand.get('handedness') for hand in hands if hand.get('handedness') != 'Unknown')
-        keys_to_remove = [k for k in self.last_hand_positions.keys() if k not in detected_keys]
-        for key in keys_to_remove:
-            del self.last_hand_positions[key]
+        # Forget hands that are no longer detected
+        for handedness, slot in HAND_SLOTS.items():
+            if hand_y[slot] is not None and not any(hand.get('handedness') == handedness for hand in hands):
+                hand_y[slot] = None
         
         return gesture_hand
     
+    def _capture_loop(self):
+        """
+        Continuously grab webcam frames so the driver queue never goes stale, but only
+        decode one when the detection worker is ready for it (frames grabbed while it is
+        busy are dropped undecoded). Frames are decoded into recycled buffers (a stale
+        unconsumed frame, or one the detection worker handed back) so steady-state
+        capture allocates nothing. The webcam is released here when the loop exits.
+        """
+        try:
+            while not self._capture_stop.is_set():
+                if not self.cap.grab():
+                    time.sleep(0.01)
+                    continue
+                if not self._frame_wanted.is_set():
+                    continue
+                self._frame_wanted.clear()
+                
+                with self._frame_lock:
+                    buffer = self._spare_frame
+                    self._spare_frame = None
+                ret, frame = self.cap.retrieve(buffer)
+                if not ret:
+                    with self._frame_lock:
+                        self._spare_frame = buffer
+                    time.sleep(0.01)
+                    continue
+                with self._frame_lock:
+                    stale = self._latest_frame
+                    self._latest_frame = frame
+                    if stale is not None:
+                        self._spare_frame = stale
+        finally:
+            # Release from this thread: another thread releasing the webcam while a
+            # native grab()/retrieve() is still running on it can crash or hang
+            self.cap.release()
+    
+    def _recycle_frame(self, frame):
+        """Hand a processed frame back to the capture thread to read the next one into."""
+        with self._frame_lock:
+            if self._spare_frame is None:
+                self._spare_frame = frame
+    
+    def _take_latest_frame(self):
+        """Return the newest unprocessed webcam frame, or None if there isn't one yet."""
+        with self._frame_lock:
+            frame = self._latest_frame
+            self._latest_frame = None
+        return frame
+    
+    def _inference_loop(self):
+        """
+        Run hand detection on the newest webcam frame, off the render thread, at most
+        once per period. The period stretches towards max_infer_period while detection
+        is slow, leaving CPU time for rendering, and recovers once it speeds up again.
+        """
+        period = self.infer_period
+        next_infer = 0.0
+        error_reported = False
+        while not self._capture_stop.is_set():
+            wait = next_infer - time.monotonic()
+            if wait > 0:
+                self._capture_stop.wait(wait)
+                continue
+            # Ask the capture thread to decode the next grabbed frame
+            self._frame_wanted.set()
+            frame = self._take_latest_frame()
+            if frame is None:
+                time.sleep(0.005)
+                continue
+            
+            started = time.monotonic()
+            try:
+                # Mirror in place; the frame is owned by this thread once taken from the slot
+                cv2.flip(frame, 1, dst=frame)
+                hands = self.filter_hands(self._detect_scaled(frame))
+                # Draw hand detection boxes on frame (in place, it is recycled afterwards) and
+                # shrink it to the thumbnail size here with OpenCV, unless the preview is hidden
+                frame_with_boxes = None
+                if self._preview_visible:
+                    frame_with_boxes = cv2.resize(self.hand_detector.draw_detections(frame, hands, in_place=True),
+                                                  WEBCAM_PREVIEW_SIZE, interpolation=cv2.INTER_AREA)
+                with self._result_lock:
+                    self._latest_result = (hands, frame_with_boxes)
+            except Exception as e:
+                # An error on one frame must not end this thread (hand control and the
+                # preview would silently freeze): report the first one and carry on
+                if not error_reported:
+                    error_reported = True
+                    print(f"Error in hand detection: {e}")
+                    import traceback
+                    traceback.print_exc()
+            finally:
+                # Nothing published above refers to the frame itself (the thumbnail is a resized copy)
+                self._recycle_frame(frame)
+            
+            if time.monotonic() - started > self.slow_infer_time:
+                period = min(period * 1.5, self.max_infer_period)
+            else:
+                period = max(period * 0.9, self.infer_period)
+            next_infer = started + period
+    
+    def _detect_scaled(self, frame):
+        """
+        Detect hands on a downscaled copy of the frame and map the results back to
+        full-frame coordinates. The detector resizes to a small input tensor internally,
+        so the extra pixels only cost conversion time.
+        """
+        height, width = frame.shape[:2]
+        if not self.detect_width or width <= self.detect_width:
+            return self.hand_detector.detect_hands(frame)
+        
+        scale = width / self.detect_width
+        small = cv2.resize(frame, (self.detect_width, round(height / scale)), interpolation=cv2.INTER_AREA)
+        hands = self.hand_detector.detect_hands(small)
+        for hand in hands:
+            x, y, w, h = hand['bbox']
+            hand['bbox'] = (int(x * scale), int(y * scale), int(w * scale), int(h * scale))
+            cx, cy = hand['center']
+            hand['center'] = (int(cx * scale), int(cy * scale))
+        return hands
+    
+    def _take_latest_result(self):
+        """Return the newest (hands, frame) detection result not yet consumed, or None."""
+        with self._result_lock:
+            result = self._latest_result
+            self._latest_result = None
+        return result
+    
+    def _stop_capture(self):
+        """Stop the capture and detection threads and release the webcam."""
+        self._capture_stop.set()
+        started = bool(self._threads)
+        for thread in self._threads:
+            thread.join(timeout=1.0)
+        self._threads = []
+        # The capture thread releases the webcam itself on exit (even after a stalled
+        # grab()/retrieve() returns); only release it here if that thread never ran
+        if self.cap is not None and not started:
+            self.cap.release()
+    
     def run(self):
         """
         Main game loop with hand gesture control.
@@ -221,79 +356,93 @@ class RhythmHandController:
         """
         # Show loading screen
         try:
-            from core.loading import LoadingScreen
             loading = LoadingScreen(self.game.screen)
             loading.play()
         except Exception as e:
             print(f"Error showing loading screen: {e}")
 
-        while self.running:
-            # Handle Pygame events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return 'exit'
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_F11:
-                        # Toggle fullscreen
-                        self.toggle_fullscreen()
-                    elif event.key == pygame.K_ESCAPE or event.key == pygame.K_p:
-                        # Show pause menu
-                        try:
-                            from ui.pause_menu import PauseMenu
-                            
-                            # Get screen dimensions
-                            screen_width = self.game.screen.get_width()
-                            screen_height = self.game.screen.get_height()
-                            
-                            pause_menu = PauseMenu(
-                                self.game.screen,
-                                screen_width,
-                                screen_height
-                            )
-                            # Capture current screen as background
-                            background = self.game.screen.copy()
-                            result = pause_menu.run(background)
-                            
-                            if result == 'main_menu':
-                                self.running = False
-                                return 'main_menu'
-                            elif result == 'exit':
-                                self.running = False
-                                return 'exit'
-                            # If 'resume', continue game loop
-                        except Exception as e:
-                            print(f"Error showing pause menu: {e}")
-                            import traceback
-                            traceback.print_exc()
-                    elif event.key == pygame.K_r and self.game.game_over:
-                        self.game.reset()
-                    # Keyboard controls for testing
-                    elif event.key == pygame.K_a:
-                        self.game.handle_hand_gesture('Left')
-                    elif event.key == pygame.K_l:
-                        self.game.handle_hand_gesture('Right')
-            
-            # Process hand gesture control
-            if self.use_hand_control and self.cap is not None:
-                self.frame_counter += 1
-                if self.frame_counter % self.frame_skip == 0:
-                    ret, frame = self.cap.read()
-                    if ret:
-                        frame = cv2.flip(frame, 1)
-                        hands_raw = self.hand_detector.detect_hands(frame)
-                        hands = self.filter_hands(hands_raw)
-                        
+        if self.cap is not None:
+            self._capture_stop.clear()
+            self._threads = [threading.Thread(target=self._capture_loop, daemon=True),
+                             threading.Thread(target=self._inference_loop, daemon=True)]
+            for thread in self._threads:
+                thread.start()
+        
+        # Frames are paced against a fixed deadline schedule rather than clock.tick()
+        frame_time = 1.0 / FPS
+        next_frame = time.perf_counter()
+        
+        try:
+            while self.running:
+                # Handle Pygame events (drop mouse motion and other unhandled events in bulk)
+                pygame.event.get(exclude=HANDLED_EVENTS)
+                for event in pygame.event.get(HANDLED_EVENTS, pump=False):
+                    if event.type == pygame.QUIT:
+                        return 'exit'
+                    elif event.type in (pygame.VIDEOEXPOSE, pygame.VIDEORESIZE):
+                        # Window contents were lost or resized: repaint everything next frame
+                        self._screen_size = self.game.screen.get_size()
+                        self.game.invalidate()
+                    elif event.type == pygame.KEYDOWN:
+                        if event.key == pygame.K_F11:
+                            # Toggle fullscreen
+                            self.toggle_fullscreen()
+                        elif event.key == pygame.K_ESCAPE or event.key == pygame.K_p:
+                            # Show pause menu
+                            try:
+                                # Get screen dimensions
+                                screen_width, screen_height = self._screen_size
+                                
+                                pause_menu = PauseMenu(
+                                    self.game.screen,
+                                    screen_width,
+                                    screen_height
+                                )
+                                # Capture current screen as background
+                                background = self.game.screen.copy()
+                                result = pause_menu.run(background)
+                                
+                                if result == 'main_menu':
+                                    self.running = False
+                                    return 'main_menu'
+                                elif result == 'exit':
+                                    self.running = False
+                                    return 'exit'
+                                # If 'resume', continue game loop (pause menu drew over the screen)
+                                self.game.invalidate()
+                            except Exception as e:
+                                print(f"Error showing pause menu: {e}")
+                                import traceback
+                                traceback.print_exc()
+                        elif event.key == pygame.K_r and self.game.game_over:
+                            self.game.reset()
+                        # Keyboard controls for testing
+                        elif event.key == pygame.K_a:
+                            self.game.handle_hand_gesture('Left')
+                        elif event.key == pygame.K_l:
+                            self.game.handle_hand_gesture('Right')
+                        elif event.key == pygame.K_w:
+                            # Toggle the webcam thumbnail
+                            self.game.show_webcam = not self.game.show_webcam
+                            self.game.invalidate()
+                
+                # Process hand gesture control
+                if self.use_hand_control and self.cap is not None:
+                    # The preview is invisible when hidden or while the window is minimized
+                    self._preview_visible = self.game.show_webcam and pygame.display.get_active()
+                    
+                    # Use the newest detection result, if the worker produced one since last time
+                    detection = self._take_latest_result()
+                    if detection is not None:
+                        hands, frame_with_boxes = detection
                         self.detected_hands_info = hands
                         
-                        # Draw hand detection boxes on frame
-                        frame_with_boxes = self.hand_detector.draw_detections(frame, hands)
-                        
-                        # Convert to Pygame surface for display
-                        frame_rgb = cv2.cvtColor(frame_with_boxes, cv2.COLOR_BGR2RGB)
-                        frame_surface = pygame.image.frombuffer(frame_rgb.tobytes(), frame_rgb.shape[1::-1], "RGB")
+                        if frame_with_boxes is not None:
+                            # Wrap the thumbnail's BGR pixels directly as a Pygame surface (no color conversion or copy)
+                            frame_surface = pygame.image.frombuffer(frame_with_boxes.data, WEBCAM_PREVIEW_SIZE, "BGR")
+                            self.game.set_webcam_surface(frame_surface)
                         
-                        # Set webcam surface and hand info on game
-                        self.game.set_webcam_surface(frame_surface)
+                        # Set hand info on game
                         self.game.set_detected_hands(hands)
                         
                         # Process gesture
@@ -301,15 +450,18 @@ class RhythmHandController:
                         if gesture_hand:
                             self.game.handle_hand_gesture(gesture_hand)
             
-            # Update and draw game (game.draw() includes webcam overlay now)
-            self.game.update()
-            self.game.draw()
-            
-            self.game.clock.tick(60)
-        
-        # Cleanup
-        if self.cap is not None:
-            self.cap.release()
+                # Update and draw game (game.draw() includes webcam overlay now)
+                self.game.update()
+                self.game.draw()
+                
+                next_frame += frame_time
+                if next_frame - time.perf_counter() < -0.1:
+                    # Fell far behind (slow frame, pause menu): resync instead of rushing to catch up
+                    next_frame = time.perf_counter()
+                wait_until(next_frame)
+        finally:
+            # Cleanup (also on early return to the menu, so the webcam is free for the next game)
+            self._stop_capture()
         cv2.destroyAllWindows()
         # Note: Don't quit pygame here - menu may still be running
         return None  # Game ended normally
@@ -328,22 +480,28 @@ def main():
     
     args = parser.parse_args()
     
-    print("=" * 60)
-    print("Rhythm Hand Game")
-    print("=" * 60)
-    print(f"Model: {args.model}")
-    print(f"Hand Control: {'Enabled' if not args.no_hand else 'Disabled'}")
-    print("\nControls:")
-    print("  - 👈 Wave LEFT hand for BLUE notes")
-    print("  - Wave RIGHT hand 👉 for RED notes")
-    print("  - Hit notes at the YELLOW line for points!")
+    # Build the banner first and write it in one go rather than one flush per line
+    banner = [
+        "=" * 60,
+        "Rhythm Hand Game",
+        "=" * 60,
+        f"Model: {args.model}",
+        f"Hand Control: {'Enabled' if not args.no_hand else 'Disabled'}",
+        "\nControls:",
+        "  - 👈 Wave LEFT hand for BLUE notes",
+        "  - Wave RIGHT hand 👉 for RED notes",
+        "  - Hit notes at the YELLOW line for points!",
+    ]
     if args.model == 'mediapipe':
-        print("  - MediaPipe detects left/right hands automatically!")
-    print("  - Keyboard: A = Left, L = Right (for testing)")
-    print("  - Press R to restart after game over")
-    print("  - Press ESC to quit")
-    print("=" * 60)
-    print()
+        banner.append("  - MediaPipe detects left/right hands automatically!")
+    banner += [
+        "  - Keyboard: A = Left, L = Right (for testing)",
+        "  - Press W to show/hide the webcam preview",
+        "  - Press R to restart after game over",
+        "  - Press ESC to quit",
+        "=" * 60,
+    ]
+    print("\n".join(banner) + "\n", flush=True)
     
     controller = RhythmHandController(
         use_hand_control=not args.no_hand,
@@ -1,7 +1,9 @@
 import pygame
+import numpy as np
 import random
 import sys
 import time
+from collections import deque
 from typing import List, Optional
 from core.sound_manager import SoundManager
 # Initialize Pygame
@@ -21,6 +23,8 @@ GREEN = (100, 255, 100)
 YELLOW = (255, 255, 100)
 GRAY = (100, 100, 100)
 PURPLE = (200, 100, 255)
+BRIGHT_BLUE = (150, 200, 255)  # BLUE + 50 per channel, for long notes
+BRIGHT_RED = (255, 150, 150)  # RED + 50 per channel, for long notes
 
 # Game settings
 NOTE_WIDTH = 80
@@ -34,6 +38,14 @@ FEVER_SPAWN_INTERVAL = 15  # frames between notes during fever mode
 LEFT_LANE_X = 250
 RIGHT_LANE_X = 550
 LONG_NOTE_CHANCE = 0.15  # 15% chance to spawn a long note
+WEBCAM_PREVIEW_SIZE = (160, 120)  # Webcam thumbnail in the bottom-right corner
+KEYBOARD_LOOP_EVENTS = (pygame.QUIT, pygame.KEYDOWN, pygame.VIDEORESIZE, pygame.VIDEOEXPOSE)  # Events the keyboard-only run() loop reacts to
+
+# Font sizes (default font)
+FONT_SIZE = 36
+BIG_FONT_SIZE = 72
+SMALL_FONT_SIZE = 24  # Detailed stats and hand detection status
+LABEL_FONT_SIZE = 20  # Webcam label
 
 # Timing windows (in pixels from hit zone)
 PERFECT_WINDOW = 20
@@ -52,9 +64,119 @@ FEVER_MODE_TRIGGER_INTERVAL = 400  # Start fever mode every 600 frames (10 secon
 FINALE_MODE_DURATION = 300  # frames (10 seconds at 60 FPS)
 FINALE_HIT_COOLDOWN = 10  # Frames between freestyle hits (for rapid tapping)
 FINALE_POINTS_PER_HIT = 50  # Points per freestyle hit in finale
+FINALE_FLASH_COLORS = [(255, 0, 0), (255, 165, 0), (255, 255, 0), (0, 255, 0), (0, 0, 255), (128, 0, 128)]
+
+# Shared font/text caches (filled on first use, after pygame.init())
+_fonts = {}  # size -> Font
+_text_surfaces = {}  # (text, size, color, background, outline) -> rendered Surface
+_long_note_bodies = {}  # lane -> pre-rendered gradient + stripes Surface
+_note_surfaces = {}  # (lane, is_fever) -> pre-rendered regular note Surface
+
+
+def wait_until(deadline: float):
+    """
+    Sleep until the given time.perf_counter() deadline. Coarse sleeps stop 1 ms short
+    and the rest is yielded away, since OS sleeps can overshoot by several ms.
+    """
+    while True:
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            return
+        if remaining > 0.002:
+            time.sleep(remaining - 0.001)
+        else:
+            time.sleep(0)
+
+
+def _get_font(size: int):
+    """Return the default font at the given size, loading it only once."""
+    font = _fonts.get(size)
+    if font is None:
+        font = _fonts[size] = pygame.font.Font(None, size)
+    return font
+
+
+def _render_text(text: str, size: int, color, background=None, outline: int = 0):
+    """
+    Render text with the default font, reusing the surface for repeated strings.
+    
+    Text over a known solid background is rendered onto it as an opaque surface, so
+    blitting it is a plain copy instead of a per-pixel alpha blend. With an outline,
+    a black copy offset by that many pixels at the four corners is composited in;
+    centering the result on a point centers the text too.
+    """
+    key = (text, size, color, background, outline)
+    surface = _text_surfaces.get(key)
+    if surface is None:
+        font = _get_font(size)
+        if outline:
+            text_surface = font.render(text, True, color)
+            outline_surface = font.render(text, True, BLACK)
+            surface = pygame.Surface((text_surface.get_width() + 2 * outline, text_surface.get_height() + 2 * outline),
+                                     pygame.SRCALPHA).convert_alpha()
+            for dx, dy in [(-outline, -outline), (-outline, outline), (outline, -outline), (outline, outline)]:
+                surface.blit(outline_surface, (outline + dx, outline + dy))
+            surface.blit(text_surface, (outline, outline))
+        elif background is None:
+            surface = font.render(text, True, color).convert_alpha()
+        else:
+            surface = font.render(text, True, color, background).convert()
+        if len(_text_surfaces) >= 256:
+            _text_surfaces.clear()
+        _text_surfaces[key] = surface
+    return surface
+
+
+def _get_note_surface(lane: str, is_fever: bool):
+    """Return a regular note (fill, borders and hand label) drawn once per lane/fever variant."""
+    key = (lane, is_fever)
+    surface = _note_surfaces.get(key)
+    if surface is None:
+        surface = pygame.Surface((NOTE_WIDTH, NOTE_HEIGHT)).convert()
+        rect = surface.get_rect()
+        surface.fill(BLUE if lane == 'Left' else RED)
+        
+        # Add purple glow for fever mode notes
+        if is_fever:
+            pygame.draw.rect(surface, PURPLE, rect, 4)
+        pygame.draw.rect(surface, WHITE, rect, 2)
+        
+        # Draw hand indicator
+        text = "👈 6" if lane == 'Left' else "7 👉"
+        text_surface = _render_text(text, 24, WHITE)
+        surface.blit(text_surface, text_surface.get_rect(center=rect.center))
+        _note_surfaces[key] = surface
+    return surface
+
+
+def _get_long_note_body(lane: str):
+    """Return the long note's gradient body with its stripes, drawn once per lane."""
+    body = _long_note_bodies.get(lane)
+    if body is None:
+        bright_color = BRIGHT_BLUE if lane == 'Left' else BRIGHT_RED
+        
+        # Lines include both end points, hence the extra pixel of width
+        width = NOTE_WIDTH + 1
+        body = pygame.Surface((width, LONG_NOTE_HEIGHT)).convert()
+        
+        # Gradient fading to half brightness from top to bottom, one color per row,
+        # broadcast across the width (surfarray arrays are indexed [x, y, channel])
+        alpha = 1 - (np.arange(LONG_NOTE_HEIGHT) / LONG_NOTE_HEIGHT) * 0.5
+        rows = (alpha[:, None] * np.array(bright_color)[None, :]).astype(np.uint8)
+        pygame.surfarray.blit_array(body, np.broadcast_to(rows, (width, LONG_NOTE_HEIGHT, 3)))
+        
+        # Stripes to indicate it's a long note
+        for i in range(0, LONG_NOTE_HEIGHT, 20):
+            pygame.draw.line(body, YELLOW, (0, i), (width - 1, i), 2)
+        _long_note_bodies[lane] = body
+    return body
 
 
 class Note:
+    # Fixed attribute layout: the per-frame update/draw loops read these on every note
+    __slots__ = ('lane', 'y', 'x', 'width', 'height', 'active', 'hit', 'is_fever')
+    is_long_note = False  # Class-level flag, cheaper than isinstance() in the per-frame loops
+    
     def __init__(self, lane: str, y: float = 0, is_fever: bool = False):
         """
         Create a note that falls down the screen.
@@ -83,27 +205,11 @@ class Note:
             
     def draw(self, screen):
         """Draw the note."""
-        if not self.active:
+        # Nothing to draw once it has dropped below the screen
+        if not self.active or self.y >= SCREEN_HEIGHT:
             return
             
-        color = BLUE if self.lane == 'Left' else RED
-        
-        # Draw note rectangle
-        rect = pygame.Rect(self.x - self.width // 2, int(self.y), self.width, self.height)
-        pygame.draw.rect(screen, color, rect)
-        
-        # Add purple glow for fever mode notes
-        if self.is_fever:
-            pygame.draw.rect(screen, PURPLE, rect, 4)
-        
-        pygame.draw.rect(screen, WHITE, rect, 2)
-        
-        # Draw hand indicator
-        font = pygame.font.Font(None, 24)
-        text = "👈 6" if self.lane == 'Left' else "7 👉"
-        text_surface = font.render(text, True, WHITE)
-        text_rect = text_surface.get_rect(center=(self.x, int(self.y) + self.height // 2))
-        screen.blit(text_surface, text_rect)
+        screen.blit(_get_note_surface(self.lane, self.is_fever), (self.x - self.width // 2, int(self.y)))
         
     def get_distance_from_hit_zone(self) -> float:
         """Get distance from center of hit zone."""
@@ -113,6 +219,9 @@ class Note:
 class LongNote(Note):
     """Long note that requires rapid hits to stack up points."""
     
+    __slots__ = ('hit_count', 'hit_cooldown', 'in_hit_zone', 'total_points', '_rect')
+    is_long_note = True
+    
     def __init__(self, lane: str, y: float = 0, is_fever: bool = False):
         """
         Create a long note that requires rapid hand movements.
@@ -124,7 +233,8 @@ class LongNote(Note):
         """
         super().__init__(lane, y, is_fever)
         self.height = LONG_NOTE_HEIGHT
-        self.is_long_note = True
+        # Drawn area; only its y changes as the note falls
+        self._rect = pygame.Rect(self.x - self.width // 2, 0, self.width, self.height)
         self.hit_count = 0  # Track number of rapid hits
         self.hit_cooldown = 0  # Cooldown between hits
         self.in_hit_zone = False  # Track if note is currently in hit zone
@@ -168,28 +278,20 @@ class LongNote(Note):
         return 0
     
     def draw(self, screen):
-        """Draw the long note with special visual effects."""
-        if not self.active:
-            return
-        
-        # Base color
-        color = BLUE if self.lane == 'Left' else RED
-        
-        # Make color brighter for long notes
-        bright_color = tuple(min(255, c + 50) for c in color)
+        """Draw the long note with special visual effects. Returns the area drawn."""
+        # Skip the whole note while it is entirely above or below the screen
+        half_height = self.height // 2
+        if not self.active or self.y - half_height >= SCREEN_HEIGHT or self.y + half_height < 0:
+            return None
         
         # Draw long note rectangle
-        rect = pygame.Rect(self.x - self.width // 2, int(self.y - self.height // 2), 
-                          self.width, self.height)
-        
-        # Draw gradient effect for long notes
-        for i in range(self.height):
-            y_pos = int(self.y - self.height // 2 + i)
-            alpha = 1 - (i / self.height) * 0.5
-            gradient_color = tuple(int(c * alpha) for c in bright_color)
-            pygame.draw.line(screen, gradient_color, 
-                           (self.x - self.width // 2, y_pos),
-                           (self.x + self.width // 2, y_pos))
+        rect = self._rect
+        rect.y = int(self.y - half_height)
+        
+        # Draw the pre-rendered gradient body (striped to indicate it's a long note);
+        # it is a pixel wider than rect, so the drawn area starts from the blit itself
+        drawn = screen.blit(_get_long_note_body(self.lane), rect.topleft)
+        drawn.union_ip(rect)
         
         # Add visual feedback for hit readiness
         if self.in_hit_zone:
@@ -207,32 +309,18 @@ class LongNote(Note):
         # Draw border with special pattern
         pygame.draw.rect(screen, WHITE, rect, 2)
         
-        # Draw stripes to indicate it's a long note
-        for i in range(0, self.height, 20):
-            stripe_y = int(self.y - self.height // 2 + i)
-            pygame.draw.line(screen, YELLOW, 
-                           (self.x - self.width // 2, stripe_y),
-                           (self.x + self.width // 2, stripe_y), 2)
-        
         # Draw hand indicator at center
-        font = pygame.font.Font(None, 28)
         text = "👈 RAPID!" if self.lane == 'Left' else "RAPID! 👉"
-        text_surface = font.render(text, True, YELLOW)
-        text_rect = text_surface.get_rect(center=(self.x, int(self.y)))
-        
-        # Add black outline for text
-        outline_font = pygame.font.Font(None, 28)
-        for dx, dy in [(-1, -1), (-1, 1), (1, -1), (1, 1)]:
-            outline_text = outline_font.render(text, True, BLACK)
-            screen.blit(outline_text, (text_rect.x + dx, text_rect.y + dy))
-        
-        screen.blit(text_surface, text_rect)
+        # (with a black outline for the text)
+        text_surface = _render_text(text, 28, YELLOW, outline=1)
+        drawn.union_ip(screen.blit(text_surface, text_surface.get_rect(center=(self.x, int(self.y)))))
         
         # Show hit count if any hits registered
         if self.hit_count > 0:
-            count_text = font.render(f"x{self.hit_count}", True, GREEN)
+            count_text = _render_text(f"x{self.hit_count}", 28, GREEN)
             count_rect = count_text.get_rect(center=(self.x, int(self.y + 30)))
-            screen.blit(count_text, count_rect)
+            drawn.union_ip(screen.blit(count_text, count_rect))
+        return drawn
 
 
 class RhythmGame:
@@ -244,17 +332,103 @@ class RhythmGame:
             self.screen = pygame.display.set_mode((800, 600), pygame.RESIZABLE)
         pygame.display.set_caption("Rhythm Hand Game")
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.Font(None, 36)
-        self.big_font = pygame.font.Font(None, 72)
-        self.small_font = pygame.font.Font(None, 24)
+        self.font = _get_font(FONT_SIZE)
+        self.big_font = _get_font(BIG_FONT_SIZE)
+        self.small_font = _get_font(SMALL_FONT_SIZE)
         self.webcam_surface = None  # For external webcam feed
+        self._webcam_fresh = False  # A new webcam frame arrived since the thumbnail was last drawn
+        self.show_webcam = True  # Whether the webcam thumbnail is drawn (toggle with W)
         self.detected_hands_info = []  # For hand detection info
         self.sound_manager = SoundManager()
+        self._build_static_surfaces()
+        self._start_screen = None  # Dimmed start screen with its text, built on first use
+        self._webcam_label = None  # "Webcam" tag with its translucent background
+        
+        # Dirty rect tracking: areas drawn this frame and last frame
+        self._dirty = []
+        self._prev_dirty = []
+        self._webcam_dirty = []  # Webcam thumbnail areas, presented but not restored next frame
+        self._full_redraw = True
+        self._last_mode = None
+        self._frozen_frame = None  # Finished start/game over screen, restored under the webcam overlay
         self.reset()
         
+    def _build_static_surfaces(self):
+        """
+        Render the fixed labels and banners once and lay out their rects.
+        Cached text is converted to the display's pixel format so blits skip conversion.
+        """
+        self._static = {
+            'left_label': _render_text("👈 LEFT", FONT_SIZE, BLUE),
+            'right_label': _render_text("RIGHT 👉", FONT_SIZE, RED),
+            # Banners with their black outlines composited in
+            'fever_text': _render_text("FEVER MODE!", BIG_FONT_SIZE, YELLOW, outline=2),
+            'mult_text': _render_text("2x POINTS!", FONT_SIZE, GREEN),
+            'finale_title': _render_text("67 MODE!", BIG_FONT_SIZE, YELLOW, outline=3),
+            'finale_instr': _render_text("WAVE AS FAST AS YOU CAN!", FONT_SIZE, WHITE),
+        }
+        self._fever_rect = self._static['fever_text'].get_rect(center=(SCREEN_WIDTH // 2, 80))
+        self._mult_rect = self._static['mult_text'].get_rect(center=(SCREEN_WIDTH // 2, 130))
+        self._finale_rect = self._static['finale_title'].get_rect(center=(SCREEN_WIDTH // 2, 100))
+        self._inst_rect = self._static['finale_instr'].get_rect(center=(SCREEN_WIDTH // 2, 160))
+        
+        self._lane_left_rect = pygame.Rect(LEFT_LANE_X - NOTE_WIDTH // 2 - 10, 0, NOTE_WIDTH + 20, SCREEN_HEIGHT)
+        self._lane_right_rect = pygame.Rect(RIGHT_LANE_X - NOTE_WIDTH // 2 - 10, 0, NOTE_WIDTH + 20, SCREEN_HEIGHT)
+        self._hit_zone_rect = pygame.Rect(0, HIT_ZONE_Y - HIT_ZONE_HEIGHT // 2,
+                                          SCREEN_WIDTH, HIT_ZONE_HEIGHT)
+        # Webcam thumbnail in the bottom-right corner
+        self._webcam_rect = pygame.Rect((0, 0), WEBCAM_PREVIEW_SIZE)
+        self._webcam_rect.bottomright = (SCREEN_WIDTH - 10, SCREEN_HEIGHT - 10)
+        
+        # Lanes, labels and hit zone over black, restored under moving elements each frame.
+        # Opaque surfaces are created in the display's pixel format so full-screen blits are plain copies.
+        self._static_bg = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self._static_bg.fill(BLACK)
+        self._draw_backdrop(self._static_bg)
+        
+        # Full-screen overlays, filled once; only their alpha changes per frame
+        # (the dimmed start/game over screens are composited with their text instead)
+        self._overlay_purple = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self._overlay_purple.fill(PURPLE)
+        self._finale_overlays = []
+        for flash_color in FINALE_FLASH_COLORS:
+            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+            overlay.fill(flash_color)
+            self._finale_overlays.append(overlay)
+        
+    def _draw_backdrop(self, surface):
+        """Draw the lanes, lane labels and hit zone."""
+        # Draw lanes
+        lane_color = (50, 50, 50)
+        pygame.draw.rect(surface, lane_color, self._lane_left_rect)
+        pygame.draw.rect(surface, lane_color, self._lane_right_rect)
+        
+        # Draw lane labels at top
+        surface.blit(self._static['left_label'], (LEFT_LANE_X - 50, 20))
+        surface.blit(self._static['right_label'], (RIGHT_LANE_X - 60, 20))
+        
+        # Draw hit zone
+        pygame.draw.rect(surface, (100, 100, 0, 128), self._hit_zone_rect)
+        pygame.draw.line(surface, YELLOW, (0, HIT_ZONE_Y), (SCREEN_WIDTH, HIT_ZONE_Y), 3)
+        
+    def _blit(self, surface, pos):
+        """Blit onto the screen and record the touched area as dirty."""
+        rect = self.screen.blit(surface, pos)
+        self._dirty.append(rect)
+        return rect
+        
+    def invalidate(self):
+        """Force the next draw() to repaint and present the whole screen."""
+        self._full_redraw = True
+        
     def reset(self):
         """Reset game state."""
         self.notes: List[Note] = []
+        # The same notes split by lane (and long vs regular) so hit checks only scan candidates.
+        # Each deque is in spawn order, i.e. lowest note on screen first.
+        self.notes_by_lane = {'Left': deque(), 'Right': deque()}
+        self.long_notes_by_lane = {'Left': deque(), 'Right': deque()}
+        self._active_count = 0  # Notes still on their way down (not hit, missed or off-screen)
         self.score = 0
         self.combo = 0
         self.max_combo = 0
@@ -264,12 +438,16 @@ class RhythmGame:
         self.misses = 0
         self.frame_count = 0
         self.game_over = False
+        self._game_over_screen = None  # Built once the final stats are known
         self.game_started = False
         self.last_hit_hand = None
         self.feedback_text = ""
         self.feedback_timer = 0
         self.notes_spawned = 0
         self.max_notes = 50  # Total notes in the game
+        # The whole round's (lane, is_long) sequence, drawn up front
+        self._spawn_plan = [('Left' if random.random() < 0.5 else 'Right', random.random() < LONG_NOTE_CHANCE)
+                            for _ in range(self.max_notes)]
         
         # Fever mode
         self.fever_mode = False
@@ -287,14 +465,17 @@ class RhythmGame:
         self.finale_points = 0  # Points earned during finale
         
     def spawn_note(self):
-        """Spawn a new note in random lane."""
-        lane = random.choice(['Left', 'Right'])
+        """Spawn the next planned note (random lane, sometimes a long note)."""
+        lane, is_long = self._spawn_plan[self.notes_spawned]
         
-        # Randomly spawn long notes
-        if random.random() < LONG_NOTE_CHANCE:
-            self.notes.append(LongNote(lane, is_fever=self.fever_mode))
+        if is_long:
+            note = LongNote(lane, is_fever=self.fever_mode)
+            self.long_notes_by_lane[lane].append(note)
         else:
-            self.notes.append(Note(lane, is_fever=self.fever_mode))
+            note = Note(lane, is_fever=self.fever_mode)
+            self.notes_by_lane[lane].append(note)
+        self.notes.append(note)
+        self._active_count += 1
         
         self.notes_spawned += 1
         
@@ -308,12 +489,8 @@ class RhythmGame:
         Returns:
             Hit quality: 'perfect', 'good', 'ok', 'long_hit', or None
         """
-        # Find closest active note in matching lane
-        matching_notes = [n for n in self.notes if n.active and n.lane == hand]
-        
         # Check for long notes first (they can be hit multiple times)
-        long_notes = [n for n in matching_notes if isinstance(n, LongNote)]
-        for long_note in long_notes:
+        for long_note in self.long_notes_by_lane[hand]:
             if long_note.can_hit():
                 # Apply bonus multiplier during fever mode
                 multiplier = 2 if self.fever_mode else 1
@@ -323,15 +500,21 @@ class RhythmGame:
                 self.long_note_hits += 1
                 return 'long_hit'
         
-        # For regular notes, find closest unhit note
-        regular_notes = [n for n in matching_notes if not n.hit and not isinstance(n, LongNote)]
-        
-        if not regular_notes:
+        # For regular notes, find the active unhit note closest to the hit zone. Notes in a
+        # lane fall at the same speed in spawn order, so distance shrinks from the front
+        # until the closest note and only grows after it: stop at the first increase.
+        closest_note = None
+        distance = 0
+        for note in self.notes_by_lane[hand]:
+            if note.active and not note.hit:
+                note_distance = abs(note.y - HIT_ZONE_Y)
+                if closest_note is not None and note_distance >= distance:
+                    break
+                closest_note = note
+                distance = note_distance
+        
+        if closest_note is None:
             return None
-            
-        # Get closest note to hit zone
-        closest_note = min(regular_notes, key=lambda n: n.get_distance_from_hit_zone())
-        distance = closest_note.get_distance_from_hit_zone()
         
         # Apply bonus multiplier during fever mode
         multiplier = 2 if self.fever_mode else 1
@@ -340,6 +523,7 @@ class RhythmGame:
         if distance <= PERFECT_WINDOW:
             closest_note.hit = True
             closest_note.active = False
+            self._active_count -= 1
             self.perfect_hits += 1
             self.score += 100 * multiplier
             self.combo += 1
@@ -347,6 +531,7 @@ class RhythmGame:
         elif distance <= GOOD_WINDOW:
             closest_note.hit = True
             closest_note.active = False
+            self._active_count -= 1
             self.good_hits += 1
             self.score += 50 * multiplier
             self.combo += 1
@@ -354,6 +539,7 @@ class RhythmGame:
         elif distance <= OK_WINDOW:
             closest_note.hit = True
             closest_note.active = False
+            self._active_count -= 1
             self.ok_hits += 1
             self.score += 25 * multiplier
             self.combo += 1
@@ -361,24 +547,23 @@ class RhythmGame:
             
         return None
         
-    def check_missed_notes(self):
-        """Check for notes that passed the hit zone."""
-        for note in self.notes:
-            # Long notes handle their own deactivation
-            if isinstance(note, LongNote):
-                # Check if long note is finished and had no hits
-                if not note.active and note.hit_count == 0 and not note.hit:
-                    note.hit = True  # Mark as processed
-                    self.misses += 1
-                    self.combo = 0
-                    self.show_feedback("MISS!", RED)
-            else:
-                # Regular notes
-                if note.active and not note.hit and note.y > HIT_ZONE_Y + OK_WINDOW + 20:
-                    note.active = False
-                    self.misses += 1
-                    self.combo = 0
-                    self.show_feedback("MISS!", RED)
+    def check_missed_note(self, note):
+        """Score a miss if the note just passed the hit zone (called right after note.update())."""
+        # Long notes handle their own deactivation
+        if note.is_long_note:
+            # Check if long note is finished and had no hits
+            if not note.active and note.hit_count == 0 and not note.hit:
+                note.hit = True  # Mark as processed
+                self.misses += 1
+                self.combo = 0
+                self.show_feedback("MISS!", RED)
+        else:
+            # Regular notes
+            if note.active and not note.hit and note.y > HIT_ZONE_Y + OK_WINDOW + 20:
+                note.active = False
+                self.misses += 1
+                self.combo = 0
+                self.show_feedback("MISS!", RED)
                 
     def show_feedback(self, text: str, color):
         """Show feedback text."""
@@ -487,13 +672,26 @@ class RhythmGame:
         if self.frame_count % spawn_interval == 0 and self.notes_spawned < self.max_notes and not self.finale_mode:
             self.spawn_note()
             
-        # Update notes
+        # Update notes in a single pass: move each one, check it for a miss
+        # (not during finale) and count the ones that finish this frame
+        check_misses = not self.finale_mode
         for note in self.notes:
-            note.update()
-            
-        # Check for missed notes (not during finale)
-        if not self.finale_mode:
-            self.check_missed_notes()
+            if note.active:
+                note.update()
+                if check_misses:
+                    self.check_missed_note(note)
+                if not note.active:
+                    self._active_count -= 1
+        
+        # Forget finished notes, so later frames only walk live ones
+        if len(self.notes) != self._active_count:
+            self.notes = [n for n in self.notes if n.active]
+        
+        # Drop finished notes from the front of the per-lane hit candidates
+        # (a note hit out of order is skipped until the notes ahead of it finish)
+        for lane_notes in (*self.notes_by_lane.values(), *self.long_notes_by_lane.values()):
+            while lane_notes and not lane_notes[0].active:
+                lane_notes.popleft()
         
         # Update feedback timer
         if self.feedback_timer > 0:
@@ -501,50 +699,52 @@ class RhythmGame:
             
         # Check if all notes spawned and all have left the screen - trigger FINALE MODE!
         if self.notes_spawned >= self.max_notes and not self.finale_mode:
-            active_notes = [n for n in self.notes if n.active]
-            if len(active_notes) == 0:  # When all notes have left the screen, start finale
+            if self._active_count == 0:  # When all notes have left the screen, start finale
                 self.finale_mode = True
                 self.finale_mode_timer = FINALE_MODE_DURATION
                 self.fever_mode = False  # End fever mode if active
                 self.show_feedback("FINALE! GO CRAZY!", YELLOW)
                 
-    def draw(self):
-        """Draw everything."""
-        # Background
-        self.screen.fill(BLACK)
-        
-        # Fever mode background effect
-        if self.fever_mode and self.game_started and not self.game_over:
-            # Pulsing background effect
+    def _draw_scene(self, full: bool):
+        """Draw the background, notes, UI and start/game over screens (everything under the webcam overlay)."""
+        if not full:
+            # Erase last frame's moving elements by restoring the backdrop underneath
+            for rect in self._prev_dirty:
+                self.screen.blit(self._static_bg, rect, rect)
+        elif self.fever_mode and self.game_started and not self.game_over:
+            # Background
+            self.screen.fill(BLACK)
+            
+            # Fever mode background effect: pulsing purple under the lanes
             pulse = abs((self.fever_mode_timer % 30) - 15) / 15.0
             overlay_alpha = int(50 + pulse * 50)
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            overlay.set_alpha(overlay_alpha)
-            overlay.fill(PURPLE)
-            self.screen.blit(overlay, (0, 0))
-        
-        # Draw lanes
-        lane_color = (50, 50, 50)
-        pygame.draw.rect(self.screen, lane_color, 
-                        (LEFT_LANE_X - NOTE_WIDTH // 2 - 10, 0, NOTE_WIDTH + 20, SCREEN_HEIGHT))
-        pygame.draw.rect(self.screen, lane_color,
-                        (RIGHT_LANE_X - NOTE_WIDTH // 2 - 10, 0, NOTE_WIDTH + 20, SCREEN_HEIGHT))
-        
-        # Draw lane labels at top
-        left_label = self.font.render("👈 LEFT", True, BLUE)
-        right_label = self.font.render("RIGHT 👉", True, RED)
-        self.screen.blit(left_label, (LEFT_LANE_X - 50, 20))
-        self.screen.blit(right_label, (RIGHT_LANE_X - 60, 20))
-        
-        # Draw hit zone
-        hit_zone_rect = pygame.Rect(0, HIT_ZONE_Y - HIT_ZONE_HEIGHT // 2, 
-                                    SCREEN_WIDTH, HIT_ZONE_HEIGHT)
-        pygame.draw.rect(self.screen, (100, 100, 0, 128), hit_zone_rect)
-        pygame.draw.line(self.screen, YELLOW, (0, HIT_ZONE_Y), (SCREEN_WIDTH, HIT_ZONE_Y), 3)
-        
-        # Draw notes
+            self._overlay_purple.set_alpha(overlay_alpha)
+            self.screen.blit(self._overlay_purple, (0, 0))
+            self._draw_backdrop(self.screen)
+        else:
+            # Fullscreen windows are larger than the backdrop
+            if self.screen.get_size() != (SCREEN_WIDTH, SCREEN_HEIGHT):
+                self.screen.fill(BLACK)
+            self.screen.blit(self._static_bg, (0, 0))
+        
+        # Draw notes (notes hit since the last update are still listed, skip them without a call).
+        # Regular notes are pre-rendered, so they go out in one blits() call;
+        # long notes draw their hit-state glow themselves, on top.
+        note_blits = []
+        long_notes = []
         for note in self.notes:
-            note.draw(self.screen)
+            if not note.active:
+                continue
+            if note.is_long_note:
+                long_notes.append(note)
+            elif note.y < SCREEN_HEIGHT:
+                note_blits.append((_get_note_surface(note.lane, note.is_fever),
+                                   (note.x - NOTE_WIDTH // 2, int(note.y))))
+        self._dirty.extend(self.screen.blits(note_blits))
+        for note in long_notes:
+            note_rect = note.draw(self.screen)
+            if note_rect:
+                self._dirty.append(note_rect)
             
         # Draw UI
         self.draw_ui()
@@ -557,24 +757,40 @@ class RhythmGame:
         if self.game_over:
             self.draw_game_over()
         
+    def draw(self):
+        """Draw everything."""
+        # Fever/finale full-screen effects (and any mode switch) repaint everything;
+        # otherwise only the areas drawn last frame are restored
+        mode = (self.game_started, self.game_over, self.fever_mode, self.finale_mode)
+        full = self._full_redraw or mode != self._last_mode or self.fever_mode or self.finale_mode
+        self._last_mode = mode
+        self._full_redraw = False
+        
+        # The start and game over screens don't change once drawn, apart from the webcam overlay
+        frozen = not self.game_started or self.game_over
+        
+        if frozen and not full:
+            # Restore last frame's webcam overlay areas from the finished screen
+            for rect in self._prev_dirty:
+                self.screen.blit(self._frozen_frame, rect, rect)
+        else:
+            self._draw_scene(full)
+            if frozen:
+                # Keep the finished screen (without the webcam overlay) to restore from
+                self._frozen_frame = self.screen.copy()
+                self._dirty = []
+        
         # Draw webcam feed if available
-        self.draw_webcam_overlay()
+        self.draw_webcam_overlay(full)
         
         # Draw fever mode banner on top of everything (drawn last so it's in front)
         if self.fever_mode and self.game_started and not self.game_over and not self.finale_mode:
             # Fever mode banner
-            fever_text = self.big_font.render("FEVER MODE!", True, YELLOW)
-            fever_rect = fever_text.get_rect(center=(SCREEN_WIDTH // 2, 80))
-            # Add outline for better visibility
-            for dx, dy in [(-2, -2), (-2, 2), (2, -2), (2, 2)]:
-                outline_text = self.big_font.render("FEVER MODE!", True, BLACK)
-                self.screen.blit(outline_text, (fever_rect.x + dx, fever_rect.y + dy))
-            self.screen.blit(fever_text, fever_rect)
+            # (outlined for better visibility)
+            self.screen.blit(self._static['fever_text'], self._fever_rect)
             
             # Show 2x multiplier
-            multiplier_text = self.font.render("2x POINTS!", True, GREEN)
-            mult_rect = multiplier_text.get_rect(center=(SCREEN_WIDTH // 2, 130))
-            self.screen.blit(multiplier_text, mult_rect)
+            self.screen.blit(self._static['mult_text'], self._mult_rect)
         
         # Draw finale mode banner (takes over everything!)
         if self.finale_mode and self.game_started and not self.game_over:
@@ -583,101 +799,102 @@ class RhythmGame:
             alpha = int(100 + pulse * 100)
             
             # Rainbow/multicolor background flash
-            flash_colors = [(255, 0, 0), (255, 165, 0), (255, 255, 0), (0, 255, 0), (0, 0, 255), (128, 0, 128)]
-            flash_color = flash_colors[(self.finale_mode_timer // 10) % len(flash_colors)]
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            overlay = self._finale_overlays[(self.finale_mode_timer // 10) % len(self._finale_overlays)]
             overlay.set_alpha(alpha)
-            overlay.fill(flash_color)
             self.screen.blit(overlay, (0, 0))
             
             # FINALE banner
-            finale_text = self.big_font.render("67 MODE!", True, YELLOW)
-            finale_rect = finale_text.get_rect(center=(SCREEN_WIDTH // 2, 100))
-            # Add outline
-            for dx, dy in [(-3, -3), (-3, 3), (3, -3), (3, 3)]:
-                outline_text = self.big_font.render("67 MODE!", True, BLACK)
-                self.screen.blit(outline_text, (finale_rect.x + dx, finale_rect.y + dy))
-            self.screen.blit(finale_text, finale_rect)
+            self.screen.blit(self._static['finale_title'], self._finale_rect)
             
             # Instruction
-            instruction_text = self.font.render("WAVE AS FAST AS YOU CAN!", True, WHITE)
-            inst_rect = instruction_text.get_rect(center=(SCREEN_WIDTH // 2, 160))
-            self.screen.blit(instruction_text, inst_rect)
+            self.screen.blit(self._static['finale_instr'], self._inst_rect)
             
             # Timer countdown
             timer_seconds = self.finale_mode_timer / 60.0
-            timer_text = self.big_font.render(f"{timer_seconds:.1f}s", True, RED)
-            timer_rect = timer_text.get_rect(center=(SCREEN_WIDTH // 2, 220))
-            # Add outline
-            for dx, dy in [(-2, -2), (-2, 2), (2, -2), (2, 2)]:
-                outline_timer = self.big_font.render(f"{timer_seconds:.1f}s", True, BLACK)
-                self.screen.blit(outline_timer, (timer_rect.x + dx, timer_rect.y + dy))
-            self.screen.blit(timer_text, timer_rect)
+            # (with outline; cached per displayed tenth of a second)
+            timer_text = _render_text(f"{timer_seconds:.1f}s", BIG_FONT_SIZE, RED, outline=2)
+            self.screen.blit(timer_text, timer_text.get_rect(center=(SCREEN_WIDTH // 2, 220)))
             
             # Show finale stats
-            stats_text = self.font.render(f"Freestyle Hits: {self.finale_hits}", True, GREEN)
+            stats_text = _render_text(f"Freestyle Hits: {self.finale_hits}", FONT_SIZE, GREEN)
             stats_rect = stats_text.get_rect(center=(SCREEN_WIDTH // 2, 280))
             self.screen.blit(stats_text, stats_rect)
             
-            points_text = self.font.render(f"Finale Points: {self.finale_points}", True, YELLOW)
+            points_text = _render_text(f"Finale Points: {self.finale_points}", FONT_SIZE, YELLOW)
             points_rect = points_text.get_rect(center=(SCREEN_WIDTH // 2, 320))
             self.screen.blit(points_text, points_rect)
             
-        pygame.display.flip()
+        if full:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self._prev_dirty + self._dirty + self._webcam_dirty)
+        self._prev_dirty = self._dirty
+        self._dirty = []
+        self._webcam_dirty = []
         
     def draw_ui(self):
         """Draw UI elements."""
+        # The corner labels sit on plain black outside the lanes, except under the fever overlay
+        hud_bg = None if self.fever_mode else BLACK
+        
         # Score
-        score_text = self.font.render(f"Score: {self.score}", True, WHITE)
-        self.screen.blit(score_text, (10, 10))
+        score_text = _render_text(f"Score: {self.score}", FONT_SIZE, WHITE, hud_bg)
+        self._blit(score_text, (10, 10))
         
         # Combo
         if self.combo > 0:
-            combo_text = self.font.render(f"Combo: {self.combo}x", True, YELLOW)
-            self.screen.blit(combo_text, (10, 50))
+            combo_text = _render_text(f"Combo: {self.combo}x", FONT_SIZE, YELLOW, hud_bg)
+            self._blit(combo_text, (10, 50))
             
         # Stats
         stats_y = 90
         stats = [
-            f"Perfect: {self.perfect_hits}",
-            f"Good: {self.good_hits}",
-            f"OK: {self.ok_hits}",
-            f"Miss: {self.misses}",
-            f"Rapid Hits: {self.long_note_hits}"
+            (f"Perfect: {self.perfect_hits}", GRAY),
+            (f"Good: {self.good_hits}", GRAY),
+            (f"OK: {self.ok_hits}", GRAY),
+            (f"Miss: {self.misses}", GRAY),
+            (f"Rapid Hits: {self.long_note_hits}", PURPLE)
         ]
-        for i, stat in enumerate(stats):
-            color = PURPLE if "Rapid" in stat else GRAY
-            stat_text = self.small_font.render(stat, True, color)
-            self.screen.blit(stat_text, (10, stats_y))
+        for stat, color in stats:
+            stat_text = _render_text(stat, SMALL_FONT_SIZE, color, hud_bg)
+            self._blit(stat_text, (10, stats_y))
             stats_y += 25
             
         # Progress
         progress = f"Notes: {self.notes_spawned}/{self.max_notes}"
-        progress_text = self.small_font.render(progress, True, WHITE)
-        self.screen.blit(progress_text, (SCREEN_WIDTH - 150, 10))
+        progress_text = _render_text(progress, SMALL_FONT_SIZE, WHITE, hud_bg)
+        self._blit(progress_text, (SCREEN_WIDTH - 150, 10))
         
         # Fever mode timer
         if self.fever_mode:
             timer_seconds = self.fever_mode_timer / 60.0
-            timer_text = self.small_font.render(f"Fever Time: {timer_seconds:.1f}s", True, PURPLE)
-            self.screen.blit(timer_text, (SCREEN_WIDTH - 180, 40))
+            timer_text = _render_text(f"Fever Time: {timer_seconds:.1f}s", SMALL_FONT_SIZE, PURPLE)
+            self._blit(timer_text, (SCREEN_WIDTH - 180, 40))
         
         # Feedback
         if self.feedback_timer > 0:
-            feedback = self.big_font.render(self.feedback_text, True, self.feedback_color)
+            feedback = _render_text(self.feedback_text, BIG_FONT_SIZE, self.feedback_color)
             feedback_rect = feedback.get_rect(center=(SCREEN_WIDTH // 2, 200))
-            self.screen.blit(feedback, feedback_rect)
+            self._blit(feedback, feedback_rect)
             
-    def draw_start_screen(self):
-        """Draw start screen overlay."""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
+    def _compose_overlay(self, draw_text):
+        """Pre-composite the dimming overlay with the text that draw_text(surface) puts on it."""
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 200))
+        draw_text(surface)
+        return surface.convert_alpha()
         
-        title = self.big_font.render("RHYTHM HAND GAME", True, PURPLE)
+    def draw_start_screen(self):
+        """Draw start screen overlay (it never changes, so it is composited once)."""
+        if self._start_screen is None:
+            self._start_screen = self._compose_overlay(self._draw_start_text)
+        self.screen.blit(self._start_screen, (0, 0))
+        
+    def _draw_start_text(self, surface):
+        """Draw the start screen title and instructions."""
+        title = _render_text("RHYTHM HAND GAME", BIG_FONT_SIZE, PURPLE)
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 120))
-        self.screen.blit(title, title_rect)
+        surface.blit(title, title_rect)
         
         instructions = [
             "Wave hands to hit the notes!",
@@ -696,25 +913,26 @@ class RhythmGame:
             if not line:
                 text = None
             elif "LONG NOTES" in line or "FEVER MODE" in line or "FINALE" in line:
-                text = self.font.render(line, True, PURPLE)
+                text = _render_text(line, FONT_SIZE, PURPLE)
             else:
-                text = self.font.render(line, True, WHITE)
+                text = _render_text(line, FONT_SIZE, WHITE)
             
             if text:
                 text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, y))
-                self.screen.blit(text, text_rect)
+                surface.blit(text, text_rect)
             y += 30
             
     def draw_game_over(self):
-        """Draw game over screen."""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
-        
-        title = self.big_font.render("GAME OVER!", True, YELLOW)
+        """Draw game over screen (the stats are final, so it is composited once per game)."""
+        if self._game_over_screen is None:
+            self._game_over_screen = self._compose_overlay(self._draw_game_over_text)
+        self.screen.blit(self._game_over_screen, (0, 0))
+        
+    def _draw_game_over_text(self, surface):
+        """Draw the game over title, results and key hints."""
+        title = _render_text("GAME OVER!", BIG_FONT_SIZE, YELLOW)
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 100))
-        self.screen.blit(title, title_rect)
+        surface.blit(title, title_rect)
         
         # Calculate accuracy
         total_notes = self.perfect_hits + self.good_hits + self.ok_hits + self.misses
@@ -744,10 +962,10 @@ class RhythmGame:
                 
             # Use smaller font for detailed stats
             if any(stat in line for stat in ["Perfect:", "Good:", "OK:", "Miss:", "Long Note Hits:"]):
-                current_font = self.small_font
+                current_size = SMALL_FONT_SIZE
                 step = 25
             else:
-                current_font = self.font
+                current_size = FONT_SIZE
                 step = 35
                 
             if "Finale Hits" in line:
@@ -755,78 +973,100 @@ class RhythmGame:
             else:
                 color = WHITE
                 
-            text = current_font.render(line, True, color)
+            text = _render_text(line, current_size, color)
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, y))
-            self.screen.blit(text, text_rect)
+            surface.blit(text, text_rect)
             y += step
     
     def set_webcam_surface(self, surface):
-        """Set the webcam surface to display."""
-        self.webcam_surface = surface
+        """
+        Set the webcam surface to display. It is scaled to the thumbnail size (if the
+        producer hasn't already) and copied into one display-format thumbnail surface,
+        which is allocated on the first frame and reused after that.
+        """
+        if surface.get_size() != WEBCAM_PREVIEW_SIZE:
+            surface = pygame.transform.scale(surface, WEBCAM_PREVIEW_SIZE)
+        if self.webcam_surface is None:
+            self.webcam_surface = pygame.Surface(WEBCAM_PREVIEW_SIZE).convert()
+        self.webcam_surface.blit(surface, (0, 0))
+        self._webcam_fresh = True
     
     def set_detected_hands(self, hands_info):
         """Set detected hands info."""
         self.detected_hands_info = hands_info
     
-    def draw_webcam_overlay(self):
-        """Draw webcam feed and hand detection info."""
+    def draw_webcam_overlay(self, full: bool = True):
+        """
+        Draw webcam feed and hand detection info.
+        
+        Nothing else is drawn in the thumbnail's corner, so unless the whole screen is
+        being repainted it is only redrawn (and presented) when a new webcam frame arrived.
+        """
         # Draw webcam feed
-        if self.webcam_surface:
-            # Scale webcam feed
-            target_width = 160
-            target_height = 120
-            scaled_surface = pygame.transform.scale(self.webcam_surface, (target_width, target_height))
+        if self.show_webcam and self.webcam_surface and (full or self._webcam_fresh):
+            self._webcam_fresh = False
             
             # Position in bottom-right corner
-            x_pos = SCREEN_WIDTH - target_width - 10
-            y_pos = SCREEN_HEIGHT - target_height - 10
+            border_rect = self._webcam_rect
+            x_pos, y_pos = border_rect.topleft
             
-            # Draw webcam feed
-            self.screen.blit(scaled_surface, (x_pos, y_pos))
+            # Draw webcam feed (presented this frame, but not erased on the next)
+            self._webcam_dirty.append(self.screen.blit(self.webcam_surface, border_rect))
             
             # Draw border
-            border_rect = pygame.Rect(x_pos, y_pos, target_width, target_height)
-            pygame.draw.rect(self.screen, WHITE, border_rect, 3)
-            
-            # Draw label
-            label_font = pygame.font.Font(None, 20)
-            label = label_font.render("Webcam", True, WHITE)
-            label_bg = pygame.Surface((label.get_width() + 10, label.get_height() + 4))
-            label_bg.fill(BLACK)
-            label_bg.set_alpha(180)
-            self.screen.blit(label_bg, (x_pos, y_pos - 25))
-            self.screen.blit(label, (x_pos + 5, y_pos - 23))
+            self._webcam_dirty.append(pygame.draw.rect(self.screen, WHITE, border_rect, 3))
+            
+            # Draw label (text over a translucent background, composited once)
+            if self._webcam_label is None:
+                label = _render_text("Webcam", LABEL_FONT_SIZE, WHITE)
+                self._webcam_label = pygame.Surface((label.get_width() + 10, label.get_height() + 4), pygame.SRCALPHA)
+                self._webcam_label.fill((0, 0, 0, 180))
+                self._webcam_label.blit(label, (5, 2))
+                self._webcam_label = self._webcam_label.convert_alpha()
+            self._webcam_dirty.append(self.screen.blit(self._webcam_label, (x_pos, y_pos - 25)))
         
         # Draw hand detection status
         if self.detected_hands_info:
-            hand_font = pygame.font.Font(None, 24)
             y_offset = 300
             
             for hand in self.detected_hands_info:
                 handedness = hand.get('handedness', 'Unknown')
                 confidence = hand.get('confidence', 0)
                 
+                # The emoji (a fallback glyph lookup) is rendered once as a fixed
+                # piece; only the plain-text confidence part changes between frames
                 if handedness == 'Left':
                     color = (100, 150, 255)
-                    text = f"👈 Left: {confidence:.0%}"
-                    self.screen.blit(hand_font.render(text, True, color), (10, y_offset))
+                    prefix_rect = self._blit(_render_text("👈 Left: ", SMALL_FONT_SIZE, color), (10, y_offset))
+                    self._blit(_render_text(f"{confidence:.0%}", SMALL_FONT_SIZE, color), prefix_rect.topright)
                 elif handedness == 'Right':
                     color = (255, 100, 100)
-                    text = f"Right: {confidence:.0%} 👉"
-                    text_surface = hand_font.render(text, True, color)
-                    text_rect = text_surface.get_rect(right=SCREEN_WIDTH - 10, top=y_offset)
-                    self.screen.blit(text_surface, text_rect)
+                    suffix = _render_text(" 👉", SMALL_FONT_SIZE, color)
+                    suffix_rect = self._blit(suffix, suffix.get_rect(right=SCREEN_WIDTH - 10, top=y_offset))
+                    text_surface = _render_text(f"Right: {confidence:.0%}", SMALL_FONT_SIZE, color)
+                    self._blit(text_surface, text_surface.get_rect(topright=suffix_rect.topleft))
                 
                 y_offset += 30
             
     def run(self):
         """Main game loop (keyboard only)."""
         running = True
+        # Frames are paced against a fixed deadline schedule rather than clock.tick()
+        frame_time = 1.0 / FPS
+        next_frame = time.perf_counter()
+        
+        # This loop owns the window until it quits pygame: keep everything else
+        # (mouse motion etc.) out of the queue altogether
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(KEYBOARD_LOOP_EVENTS)
         
         while running:
-            for event in pygame.event.get():
+            for event in pygame.event.get(KEYBOARD_LOOP_EVENTS):
                 if event.type == pygame.QUIT:
                     running = False
+                elif event.type in (pygame.VIDEOEXPOSE, pygame.VIDEORESIZE):
+                    # Window contents were lost or resized: repaint everything next frame
+                    self.invalidate()
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                             if self.sound_manager:
@@ -841,7 +1081,12 @@ class RhythmGame:
                         
             self.update()
             self.draw()
-            self.clock.tick(FPS)
+            
+            next_frame += frame_time
+            if next_frame - time.perf_counter() < -0.1:
+                # Fell far behind (slow frame): resync instead of rushing to catch up
+                next_frame = time.perf_counter()
+            wait_until(next_frame)
         if self.sound_manager:
             self.sound_manager.stop_background_music()
         pygame.quit()
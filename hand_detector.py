@@ -237,7 +237,7 @@ class HandDetector:
         if self.hands_detector is not None:
             self.hands_detector.close()
     
-    def draw_detections(self, frame: np.ndarray, hands: List[dict]) -> np.ndarray:
+    def draw_detections(self, frame: np.ndarray, hands: List[dict], in_place: bool = False) -> np.ndarray:
         """
         Draw hand detections on frame as simple colored circles/balls.
         Always shows both left and right hand positions (ghosts if not detected).
@@ -245,11 +245,13 @@ class HandDetector:
         Args:
             frame: Input frame
             hands: List of detected hands
+            in_place: If True, draw directly on frame instead of a copy (for callers
+                      that don't need the undrawn frame afterwards)
             
         Returns:
             Frame with detections drawn as circles
         """
-        result_frame = frame.copy()
+        result_frame = frame if in_place else frame.copy()
         height, width = frame.shape[:2]
         
         # Default radius for balls